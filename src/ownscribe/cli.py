@@ -8,10 +8,10 @@ import subprocess
 
 import click
 
-from ownscribe.config import CONFIG_DIR, Config, ensure_config_file
+from ownscribe.config import CONFIG_DIR, DATA_DIR, Config, ensure_config_file
 
 # Canonical paths for cleanup
-_CACHE_DIR = os.path.expanduser("~/.local/share/ownscribe")
+_CACHE_DIR = str(DATA_DIR)
 _CONFIG_DIR = str(CONFIG_DIR)
 
 
@@ -207,7 +207,7 @@ def config_cmd() -> None:
 @click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompts.")
 @click.option("--all", "all_", is_flag=True, help="Remove everything (config + cache + output).")
 @click.option("--config", "config_", is_flag=True, help="Remove config directory (~/.config/ownscribe/).")
-@click.option("--cache", is_flag=True, help="Remove cached binary (~/.local/share/ownscribe/).")
+@click.option("--cache", is_flag=True, help="Remove cached binary and summaries (~/.local/share/ownscribe/).")
 @click.option("--output", is_flag=True, help="Remove output directory with recordings/transcripts.")
 @click.pass_context
 def cleanup(
@@ -9,6 +9,7 @@ from pathlib import Path
 
 CONFIG_DIR = Path("~/.config/ownscribe").expanduser()
 CONFIG_PATH = CONFIG_DIR / "config.toml"
+DATA_DIR = Path("~/.local/share/ownscribe").expanduser()
 
 DEFAULT_CONFIG_TOML = """\
 [audio]
@@ -20,6 +21,7 @@ mic_device = ""           # specific mic device name (empty = default)
 [transcription]
 model = "base"            # whisper model: tiny, base, small, medium, large-v3
 language = ""             # empty = auto-detect
+word_timestamps = false   # run forced alignment for word-level timestamps (always on with diarization)
 
 [diarization]
 enabled = false           # set to true + provide hf_token to enable
@@ -36,6 +38,7 @@ model = "mistral"         # model name
 host = "http://localhost:11434"  # ollama: :11434, LM Studio: :1234
 # template = "meeting"    # built-in: "meeting", "lecture", or "brief"
 # context_size = 0        # 0 = auto-detect from model; set manually for OpenAI-compatible backends
+# cache = false           # reuse the summary of an identical transcript (stored in ~/.local/share/ownscribe)
 
 # Custom templates (optional):
 # [templates.my-notes]
@@ -61,6 +64,7 @@ class AudioConfig:
 class TranscriptionConfig:
     model: str = "base"
     language: str = ""
+    word_timestamps: bool = False
 
 
 @dataclass
@@ -81,6 +85,7 @@ class SummarizationConfig:
     host: str = "http://localhost:11434"
     template: str = ""
     context_size: int = 0
+    cache: bool = False
 
 
 @dataclass
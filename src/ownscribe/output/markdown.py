@@ -24,11 +24,12 @@ def format_transcript(result: TranscriptResult) -> str:
         lines.append(f"**Duration:** {_format_time(result.duration)}  ")
     lines.append("")
 
+    has_speakers = result.has_speakers
     current_speaker = None
     for seg in result.segments:
         timestamp = f"[{_format_time(seg.start)}]"
 
-        if result.has_speakers and seg.speaker != current_speaker:
+        if has_speakers and seg.speaker != current_speaker:
             current_speaker = seg.speaker
             speaker_label = seg.speaker or "Unknown"
             lines.append(f"\n**{speaker_label}** {timestamp}")
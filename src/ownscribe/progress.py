@@ -104,6 +104,11 @@ class ProgressWriter:
         self._offset = offset
         self._scale = scale
 
+    def set_phase(self, offset: float, scale: float) -> None:
+        """Map subsequent progress output onto a new sub-range of the bar."""
+        self._offset = offset
+        self._scale = scale
+
     def write(self, text: str) -> int:
         m = _PROGRESS_RE.search(text)
         if m:
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import json
+import contextlib
+import functools
+import os
 import re
-from datetime import date
+from dataclasses import dataclass
+from itertools import accumulate, islice
 from pathlib import Path
-from typing import NamedTuple
 
 import click
 
@@ -23,6 +25,9 @@ from ownscribe.summarization.prompts import (
 
 _DEFAULT_CONTEXT_SIZE = 8192
 
+# Stage 1 batches are independent requests, so a few are kept in flight at once
+_MAX_PARALLEL_BATCHES = 4
+
 _SEARCH_RESULTS_SCHEMA = {
     "name": "search_results",
     "strict": True,
@@ -35,11 +40,13 @@ _SEARCH_RESULTS_SCHEMA = {
 }
 
 
-class Meeting(NamedTuple):
+@dataclass(frozen=True, slots=True)
+class Meeting:
     folder_name: str
     display_name: str
-    summary_path: Path
-    transcript_path: Path | None
+    transcript_path: str | None
+    summary: str  # read once at discovery, reused by every search stage
+    summary_words: frozenset[str]
 
 
 def ask(config: Config, question: str, since: str | None, limit: int | None) -> None:
@@ -77,9 +84,9 @@ def ask(config: Config, question: str, since: str | None, limit: int | None) ->
         click.echo("No relevant meetings found for your question.")
         return
 
-    click.echo(f"Found {len(relevant)} relevant meetings:")
-    for m in relevant:
-        click.echo(f"  - {m.display_name}")
+    # One write for the whole list instead of one echo per meeting
+    listing = [f"Found {len(relevant)} relevant meetings:", *(f"  - {m.display_name}" for m in relevant)]
+    click.echo("\n".join(listing))
 
     # Stage 2
     with Spinner("Analyzing transcripts"):
@@ -120,77 +127,81 @@ def _resolve_context_size(config: Config) -> int:
 _FOLDER_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})_(\d{2})(\d{2})(?:_(.+))?$")
 
 
-def _parse_folder_name(name: str) -> tuple[str, str] | None:
-    """Parse a folder name like '2026-02-13_1501_quarterly-planning'.
+def _display_name(m: re.Match[str]) -> str:
+    """Format a folder name matched by ``_FOLDER_RE`` for display.
 
-    Also accepts folders without a slug, e.g. '2026-02-16_1433'.
-    Returns (date_str, display_name) or None if the name doesn't match.
+    '2026-02-13_1501_quarterly-planning' becomes '2026-02-13 15:01 — Quarterly Planning';
+    folders without a slug, e.g. '2026-02-16_1433', become '2026-02-16 14:33'.
     """
-    m = _FOLDER_RE.match(name)
-    if not m:
-        return None
-    date_str = m.group(1)
-    hour, minute = m.group(2), m.group(3)
-    slug = m.group(4)
+    date_str, hour, minute, slug = m.groups()
     if slug:
         title = slug.replace("-", " ").title()
-        return date_str, f"{date_str} {hour}:{minute} — {title}"
-    return date_str, f"{date_str} {hour}:{minute}"
+        return f"{date_str} {hour}:{minute} — {title}"
+    return f"{date_str} {hour}:{minute}"
+
+
+def _find_file(folder: str, names: tuple[str, ...]) -> str | None:
+    """Return the path of the first of *names* that exists as a file inside *folder*."""
+    for name in names:
+        candidate = os.path.join(folder, name)
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def _read_text(path: str) -> str:
+    """Read a text file in the default encoding, like ``Path.read_text``."""
+    with open(path) as f:
+        return f.read()
 
 
 def _discover_meetings(
     output_dir: Path, since: str | None, limit: int | None,
 ) -> tuple[list[Meeting], int]:
-    if not output_dir.exists():
-        return [], 0
+    # Folder dates are zero-padded ISO strings, so --since compares as a plain string
+    since_str = ""
+    if since:
+        from datetime import date
 
-    meetings: list[Meeting] = []
-    skipped = 0
+        with contextlib.suppress(ValueError):
+            since_str = date.fromisoformat(since).isoformat()
 
-    for folder in sorted(output_dir.iterdir(), reverse=True):
-        if not folder.is_dir():
-            continue
-        parsed = _parse_folder_name(folder.name)
-        if parsed is None:
-            continue
+    try:
+        with os.scandir(output_dir) as it:
+            folders = [(entry, m) for entry in it if (m := _FOLDER_RE.match(entry.name)) and entry.is_dir()]
+    except FileNotFoundError:
+        return [], 0
+    folders.sort(key=lambda folder: folder[0].name, reverse=True)
 
-        date_str, display_name = parsed
+    candidates: list[tuple[os.DirEntry, re.Match, str, str | None]] = []
+    skipped = 0
 
-        # Find summary file
-        summary_path = None
-        for ext in ("summary.md", "summary.json"):
-            candidate = folder / ext
-            if candidate.exists():
-                summary_path = candidate
-                break
+    for entry, m in folders:
+        # Apply --since filter; newest-first order means every later folder is older too
+        if m.group(1) < since_str:
+            break
 
+        summary_path = _find_file(entry.path, ("summary.md", "summary.json"))
         if summary_path is None:
             skipped += 1
             continue
 
-        # Find transcript file
-        transcript_path = None
-        for ext in ("transcript.md", "transcript.json"):
-            candidate = folder / ext
-            if candidate.exists():
-                transcript_path = candidate
-                break
+        transcript_path = _find_file(entry.path, ("transcript.md", "transcript.json"))
+        candidates.append((entry, m, summary_path, transcript_path))
 
-        # Apply --since filter
-        if since:
-            try:
-                since_date = date.fromisoformat(since)
-                meeting_date = date.fromisoformat(date_str)
-                if meeting_date < since_date:
-                    continue
-            except ValueError:
-                pass
-
-        meetings.append(Meeting(folder.name, display_name, summary_path, transcript_path))
-
-    # Apply --limit cap (meetings are already newest-first)
+    # Apply --limit cap (candidates are already newest-first) before reading any summary
     if limit is not None and limit > 0:
-        meetings = meetings[:limit]
+        candidates = candidates[:limit]
+
+    meetings: list[Meeting] = []
+    for entry, m, summary_path, transcript_path in candidates:
+        summary = _read_text(summary_path)
+        meetings.append(
+            Meeting(
+                entry.name, _display_name(m), transcript_path,
+                summary, frozenset(_WORD_RE.findall(summary.lower())),
+            )
+        )
 
     return meetings, skipped
 
@@ -198,16 +209,26 @@ def _discover_meetings(
 # -- Token estimation --
 
 
-def _estimate_tokens(text: str) -> int:
-    return len(text) // 4
+def _estimate_tokens(*parts: str) -> int:
+    """Rough token count (~4 chars per token) of *parts* as if concatenated."""
+    return sum(map(len, parts)) // 4
 
 
 # -- Chunking --
 
 
+# Characters of the "## [folder_name]\n" header around each summary in the Stage 1 prompt
+_SUMMARY_HEADER_CHARS = len("## []\n")
+
+
 def _build_summary_chunks(
     meetings: list[Meeting], context_budget: int,
 ) -> list[list[Meeting]]:
+    """Greedily pack meetings, in order, into chunks whose summaries fit the budget.
+
+    Single pass over the cached summaries; an entry larger than the budget
+    gets a chunk of its own.
+    """
     effective = int(context_budget * 0.8)
     overhead = 1000  # system prompt + question + response headroom
     budget = max(effective - overhead, 500)
@@ -217,9 +238,7 @@ def _build_summary_chunks(
     current_size = 0
 
     for m in meetings:
-        summary_text = m.summary_path.read_text()
-        header = f"## [{m.folder_name}]\n"
-        entry_tokens = _estimate_tokens(header + summary_text)
+        entry_tokens = (len(m.folder_name) + _SUMMARY_HEADER_CHARS + len(m.summary)) // 4
 
         if current_chunk and current_size + entry_tokens > budget:
             chunks.append(current_chunk)
@@ -238,8 +257,18 @@ def _build_summary_chunks(
 # -- Stage 1: Find relevant meetings --
 
 
-_JSON_RE = re.compile(r'\{[^{}]*"relevant"[^{}]*\}', re.DOTALL)
-_ARRAY_RE = re.compile(r'\[.*?\]', re.DOTALL)
+# A JSON object mentioning "relevant", or a bare array, embedded in prose
+_RELEVANT_OBJECT_RE = re.compile(r'\{[^{}]*"relevant"[^{}]*\}', re.DOTALL)
+_ARRAY_RE = re.compile(r"\[.*?\]", re.DOTALL)
+
+
+def _coerce_ids(data: object) -> list[str] | None:
+    """Return the IDs from a parsed ``{"relevant": [...]}`` object or bare array, else None."""
+    if isinstance(data, dict):
+        data = data.get("relevant")
+    if isinstance(data, list):
+        return [str(i) for i in data]
+    return None
 
 
 def _parse_relevant_ids(response: str) -> list[str] | None:
@@ -247,37 +276,28 @@ def _parse_relevant_ids(response: str) -> list[str] | None:
 
     Returns a list of IDs, or None if parsing fails entirely.
     """
-    # Try direct JSON parse
-    try:
-        data = json.loads(response)
-        if isinstance(data, dict) and "relevant" in data:
-            ids = data["relevant"]
-            if isinstance(ids, list):
-                return [str(i) for i in ids]
-    except (json.JSONDecodeError, TypeError):
-        pass
-
-    # Fallback: regex for JSON object with "relevant"
-    m = _JSON_RE.search(response)
-    if m:
-        try:
-            data = json.loads(m.group())
-            if isinstance(data, dict) and "relevant" in data:
-                ids = data["relevant"]
-                if isinstance(ids, list):
-                    return [str(i) for i in ids]
-        except (json.JSONDecodeError, TypeError):
-            pass
+    import json
 
-    # Fallback: bare array
-    m = _ARRAY_RE.search(response)
-    if m:
+    # Fast path: the response is the JSON we asked for. Prose replies skip the
+    # doomed decode (and its exception) and go straight to the scan below.
+    if response.lstrip()[:1] in ("{", "["):
         try:
-            ids = json.loads(m.group())
-            if isinstance(ids, list):
-                return [str(i) for i in ids]
-        except (json.JSONDecodeError, TypeError):
-            pass
+            ids = _coerce_ids(json.loads(response))
+        except json.JSONDecodeError:
+            ids = None
+        if ids is not None:
+            return ids
+
+    # Fallback: first embedded {"relevant": ...} object that parses, then the
+    # first bare array, so bracketed prose never shadows the real answer
+    for pattern in (_RELEVANT_OBJECT_RE, _ARRAY_RE):
+        for m in pattern.finditer(response):
+            try:
+                ids = _coerce_ids(json.loads(m.group()))
+            except json.JSONDecodeError:
+                continue
+            if ids is not None:
+                return ids
 
     return None
 
@@ -300,13 +320,29 @@ _STOP_WORDS = frozenset([
 ])
 
 
-def _extract_keywords(text: str) -> set[str]:
-    """Extract lowercase keywords from *text*, filtering stop words."""
-    words = set(re.findall(r"[a-z]+", text.lower()))
-    filtered = words - _STOP_WORDS
+_WORD_RE = re.compile(r"[a-z]+")
+
+
+@functools.lru_cache(maxsize=256)
+def _extract_keywords(text: str, stop_words: frozenset[str] = _STOP_WORDS) -> frozenset[str]:
+    """Extract lowercase keywords from *text*, filtering *stop_words*.
+
+    Cached, since the fallback and the ranking both tokenize the same question.
+    """
+    words = frozenset(_WORD_RE.findall(text.lower()))
+    filtered = words - stop_words
     return filtered if filtered else words
 
 
+def _transcript_mentions(path: str, keywords: frozenset[str]) -> bool:
+    """Whether the transcript at *path* contains any of *keywords*, reading only up to the first hit."""
+    try:
+        with open(path) as f:
+            return any(not keywords.isdisjoint(_WORD_RE.findall(line.lower())) for line in f)
+    except FileNotFoundError:
+        return False
+
+
 def _keyword_fallback(
     question: str, meetings: list[Meeting],
 ) -> list[Meeting]:
@@ -317,16 +353,9 @@ def _keyword_fallback(
 
     matches: list[Meeting] = []
     for m in meetings:
-        summary_text = m.summary_path.read_text()
-        summary_words = set(re.findall(r"[a-z]+", summary_text.lower()))
-        if kw & summary_words:
+        # The transcript is only opened when the cached summary words miss
+        if kw & m.summary_words or (m.transcript_path and _transcript_mentions(m.transcript_path, kw)):
             matches.append(m)
-            continue
-        if m.transcript_path and m.transcript_path.exists():
-            transcript_text = m.transcript_path.read_text()
-            transcript_words = set(re.findall(r"[a-z]+", transcript_text.lower()))
-            if kw & transcript_words:
-                matches.append(m)
     return matches
 
 
@@ -336,46 +365,44 @@ def _find_relevant_meetings(
     meetings: list[Meeting],
     context_size: int,
     spinner: Spinner | None = None,
+    max_workers: int = _MAX_PARALLEL_BATCHES,
 ) -> list[Meeting]:
+    from concurrent.futures import ThreadPoolExecutor
+
     chunks = _build_summary_chunks(meetings, context_size)
-    all_relevant_ids: set[str] = set()
+    # Insertion-ordered, so duplicate IDs across batches collapse without reordering
+    relevant: dict[str, Meeting] = {}
     total_chunks = len(chunks)
 
-    for i, chunk in enumerate(chunks):
-        if total_chunks > 1 and spinner is not None:
-            spinner.update(f"Searching meetings (batch {i + 1}/{total_chunks})")
-
-        known_ids = {m.folder_name for m in chunk}
-
-        # Build summaries text
-        summaries_parts = []
-        for m in chunk:
-            summary_text = m.summary_path.read_text()
-            summaries_parts.append(f"## [{m.folder_name}]\n{summary_text}")
-        summaries = "\n\n".join(summaries_parts)
-
+    def search_chunk(chunk: list[Meeting]) -> str:
+        summaries = "\n\n".join(f"## [{m.folder_name}]\n{m.summary}" for m in chunk)
         prompt = SEARCH_FIND_PROMPT.format(question=question, summaries=summaries)
-        response = summarizer.chat(SEARCH_FIND_SYSTEM, prompt, json_mode=True, json_schema=_SEARCH_RESULTS_SCHEMA)
-
-        ids = _parse_relevant_ids(response)
-        if ids is None:
-            # Total fallback: include all from this chunk
-            all_relevant_ids.update(known_ids)
-        else:
-            # Validate: only keep IDs that exist in this chunk
-            all_relevant_ids.update(id_ for id_ in ids if id_ in known_ids)
+        return summarizer.chat(SEARCH_FIND_SYSTEM, prompt, json_mode=True, json_schema=_SEARCH_RESULTS_SCHEMA)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, total_chunks))) as pool:
+        futures = [pool.submit(search_chunk, chunk) for chunk in chunks]
+        # Responses are consumed in chunk order, so each is validated against its own chunk
+        for i, (chunk, future) in enumerate(zip(chunks, futures, strict=True)):
+            if total_chunks > 1 and spinner is not None:
+                spinner.update(f"Searching meetings (batch {i + 1}/{total_chunks})")
+
+            by_id = {m.folder_name: m for m in chunk}
+            ids = _parse_relevant_ids(future.result())
+            if ids is None:
+                # Total fallback: include all from this chunk
+                relevant.update(by_id)
+            else:
+                # Validate: only keep IDs that exist in this chunk
+                relevant.update((id_, by_id[id_]) for id_ in ids if id_ in by_id)
 
-    if not all_relevant_ids:
+    if not relevant:
         keyword_matches = _keyword_fallback(question, meetings)
         if keyword_matches:
             if spinner is not None:
                 spinner.update("Falling back to keyword search")
             return _rank_meetings(question, keyword_matches)
 
-    # Build result list from unique IDs, then rank
-    meeting_by_id = {m.folder_name: m for m in meetings}
-    relevant = [meeting_by_id[id_] for id_ in all_relevant_ids if id_ in meeting_by_id]
-    return _rank_meetings(question, relevant)
+    return _rank_meetings(question, list(relevant.values()))
 
 
 # -- Ranking --
@@ -383,21 +410,17 @@ def _find_relevant_meetings(
 
 def _rank_meetings(question: str, meetings: list[Meeting]) -> list[Meeting]:
     """Rank meetings by keyword overlap, speaker mention, and recency."""
-    question_words = set(question.lower().split())
+    question_words = frozenset(_WORD_RE.findall(question.lower()))
+    # Capitalized question words are likely names; stop words drop a leading "What" and the like
+    names = {w for word in question.split() if word[:1].isupper() for w in _WORD_RE.findall(word.lower())}
+    names -= _STOP_WORDS
 
     def score(m: Meeting) -> tuple[float, float, str]:
-        summary_text = m.summary_path.read_text().lower()
-        summary_words = set(summary_text.split())
-
-        # Keyword overlap
-        overlap = len(question_words & summary_words)
+        # Keyword overlap against the word set cached at discovery
+        overlap = len(question_words & m.summary_words)
 
         # Speaker boost: if a capitalized word in the question appears in the summary
-        speaker_boost = 0.0
-        for word in question.split():
-            if word[0:1].isupper() and len(word) > 1 and word.lower() in summary_text:
-                speaker_boost = 2.0
-                break
+        speaker_boost = 0.0 if names.isdisjoint(m.summary_words) else 2.0
 
         # Recency: folder name sorts lexicographically by date
         return (overlap + speaker_boost, speaker_boost, m.folder_name)
@@ -412,8 +435,9 @@ def _load_transcripts(meetings: list[Meeting]) -> dict[str, str]:
     """Load transcript text keyed by folder name."""
     transcripts: dict[str, str] = {}
     for m in meetings:
-        if m.transcript_path and m.transcript_path.exists():
-            transcripts[m.folder_name] = m.transcript_path.read_text()
+        if m.transcript_path:
+            with contextlib.suppress(FileNotFoundError):
+                transcripts[m.folder_name] = _read_text(m.transcript_path)
     return transcripts
 
 
@@ -432,19 +456,29 @@ def _answer_from_transcripts(
     skipped = 0
 
     for m in meetings:
-        if m.transcript_path is None or not m.transcript_path.exists():
+        try:
+            size = os.path.getsize(m.transcript_path) if m.transcript_path else None
+        except OSError:
+            size = None
+        if size is None:
+            skipped += 1
+            continue
+
+        header = f"## [{m.folder_name}] {m.display_name}\n"
+        # UTF-8 needs at most 4 bytes per character, so size // 4 is a lower bound on the
+        # text length: transcripts that cannot fit are skipped without being read
+        if (len(header) + size // 4) // 4 > budget - used_tokens:
             skipped += 1
             continue
 
-        text = m.transcript_path.read_text()
-        entry = f"## [{m.folder_name}] {m.display_name}\n{text}"
-        entry_tokens = _estimate_tokens(entry)
+        text = _read_text(m.transcript_path)
+        entry_tokens = _estimate_tokens(header, text)
 
         if used_tokens + entry_tokens > budget:
             skipped += 1
             continue
 
-        transcript_parts.append(entry)
+        transcript_parts.append(header + text)
         used_tokens += entry_tokens
 
     if not transcript_parts:
@@ -458,26 +492,28 @@ def _answer_from_transcripts(
 # -- Quote verification --
 
 
+_INLINE_QUOTE_RE = re.compile(r'"([^"]{20,})"')
+
+
 def _extract_quotes(text: str) -> list[str]:
     """Extract quoted text from the answer (> blockquotes and "..." quotes)."""
     quotes: list[str] = []
 
-    # Blockquotes: lines starting with >
-    blockquote_lines: list[str] = []
-    for line in text.split("\n"):
-        stripped = line.strip()
-        if stripped.startswith(">"):
-            blockquote_lines.append(stripped.lstrip("> ").strip())
-        else:
-            if blockquote_lines:
+    # Blockquotes: lines starting with > (most answers have none, so skip the line scan)
+    if ">" in text:
+        blockquote_lines: list[str] = []
+        for line in text.split("\n"):
+            stripped = line.strip()
+            if stripped.startswith(">"):
+                blockquote_lines.append(stripped.lstrip("> ").strip())
+            elif blockquote_lines:
                 quotes.append(" ".join(blockquote_lines))
                 blockquote_lines = []
-    if blockquote_lines:
-        quotes.append(" ".join(blockquote_lines))
+        if blockquote_lines:
+            quotes.append(" ".join(blockquote_lines))
 
     # Inline quotes: text in "..."
-    for m in re.finditer(r'"([^"]{20,})"', text):
-        quotes.append(m.group(1))
+    quotes.extend(_INLINE_QUOTE_RE.findall(text))
 
     return quotes
 
@@ -485,18 +521,16 @@ def _extract_quotes(text: str) -> list[str]:
 def _key_phrases(quote: str, min_words: int = 8, max_words: int = 12) -> list[str]:
     """Extract key phrases (8-12 word spans) from a quote for verification."""
     words = quote.split()
+    normalized = " ".join(words)
     if len(words) <= max_words:
-        return [" ".join(words)] if len(words) >= min_words else []
+        return [normalized] if len(words) >= min_words else []
 
-    phrases = []
+    # Phrases are slices of the whitespace-normalized quote; offsets[i] is where word i starts
+    offsets = list(accumulate((len(w) + 1 for w in words), initial=0))
     # Take a few spans spread across the quote
     step = max(1, (len(words) - min_words) // 3)
-    for start in range(0, len(words) - min_words + 1, step):
-        end = min(start + max_words, len(words))
-        phrases.append(" ".join(words[start:end]))
-        if len(phrases) >= 3:
-            break
-    return phrases
+    starts = islice(range(0, len(words) - min_words + 1, step), 3)
+    return [normalized[offsets[start] : offsets[min(start + max_words, len(words))] - 1] for start in starts]
 
 
 def _verify_quotes(answer: str, transcripts: dict[str, str]) -> str:
@@ -505,16 +539,13 @@ def _verify_quotes(answer: str, transcripts: dict[str, str]) -> str:
         return answer
 
     all_text = "\n".join(transcripts.values()).lower()
-    quotes = _extract_quotes(answer)
+    # Repeated quotes and overlapping spans are searched for only once
+    quote_phrases = {quote: {p.lower() for p in _key_phrases(quote)} for quote in _extract_quotes(answer)}
+    found = {p for p in set().union(*quote_phrases.values()) if p in all_text}
 
-    unverified_quotes: set[str] = set()
-    for quote in quotes:
-        phrases = _key_phrases(quote)
-        if not phrases:
-            continue
-        verified = any(phrase.lower() in all_text for phrase in phrases)
-        if not verified:
-            unverified_quotes.add(quote)
+    unverified_quotes = {
+        quote for quote, phrases in quote_phrases.items() if phrases and found.isdisjoint(phrases)
+    }
 
     if not unverified_quotes:
         return answer
@@ -9,11 +9,18 @@ if TYPE_CHECKING:
 
 def create_summarizer(config: Config) -> Summarizer:
     """Create the appropriate summarizer based on config."""
+    summarizer: Summarizer
     if config.summarization.backend == "openai":
         from ownscribe.summarization.openai_summarizer import OpenAISummarizer
 
-        return OpenAISummarizer(config.summarization, config.templates)
+        summarizer = OpenAISummarizer(config.summarization, config.templates)
     else:
         from ownscribe.summarization.ollama_summarizer import OllamaSummarizer
 
-        return OllamaSummarizer(config.summarization, config.templates)
+        summarizer = OllamaSummarizer(config.summarization, config.templates)
+
+    if config.summarization.cache:
+        from ownscribe.summarization.cache import CachingSummarizer
+
+        summarizer = CachingSummarizer(summarizer, config.summarization, config.templates)
+    return summarizer
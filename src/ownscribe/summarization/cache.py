@@ -0,0 +1,83 @@
+"""On-disk cache of summaries for identical summarization requests."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+from ownscribe.config import DATA_DIR, SummarizationConfig
+from ownscribe.summarization.base import Summarizer
+from ownscribe.summarization.prompts import resolve_template
+
+# Under the data directory, so ``ownscribe cleanup --cache`` removes cached summaries too
+CACHE_DIR = DATA_DIR / "summaries"
+
+
+class CachingSummarizer(Summarizer):
+    """Wraps a summarizer and reuses the stored summary of an identical request.
+
+    A request is identified by backend, model, the resolved system and user
+    prompts, and the transcript text; any change to one of them is a cache miss.
+    Only ``summarize`` is cached, the other calls go straight to the backend.
+    """
+
+    def __init__(
+        self,
+        inner: Summarizer,
+        config: SummarizationConfig,
+        templates: dict | None = None,
+        cache_dir: Path | None = None,
+    ) -> None:
+        self._inner = inner
+        self._config = config
+        self._templates = templates or {}
+        self._cache_dir = cache_dir or CACHE_DIR
+
+    def _key(self, transcript_text: str) -> str:
+        system, prompt = resolve_template(self._config.template, self._templates)
+        h = hashlib.blake2b(digest_size=20)
+        for part in (self._config.backend, self._config.model, system, prompt, transcript_text):
+            h.update(part.encode())
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def summarize(self, transcript_text: str) -> str:
+        path = self._cache_dir / f"{self._key(transcript_text)}.md"
+        # The cache is best-effort: a missing or unreadable entry is a miss, and a
+        # failed write never costs the summary the backend already produced
+        with contextlib.suppress(OSError, UnicodeDecodeError):
+            return path.read_text()
+
+        summary = self._inner.summarize(transcript_text)
+        if summary:
+            with contextlib.suppress(OSError):
+                self._store(path, summary)
+        return summary
+
+    def _store(self, path: Path, summary: str) -> None:
+        """Write to a temp file and rename, so a concurrent run never reads a partial entry."""
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(summary)
+            os.replace(tmp, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
+
+    def generate_title(self, summary_text: str) -> str:
+        return self._inner.generate_title(summary_text)
+
+    def chat(
+        self, system_prompt: str, user_prompt: str,
+        json_mode: bool = False, json_schema: dict | None = None,
+    ) -> str:
+        return self._inner.chat(system_prompt, user_prompt, json_mode=json_mode, json_schema=json_schema)
+
+    def is_available(self) -> bool:
+        return self._inner.is_available()
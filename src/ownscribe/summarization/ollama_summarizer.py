@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import httpx
 import ollama
 
 from ownscribe.config import SummarizationConfig
 from ownscribe.summarization.base import Summarizer
 from ownscribe.summarization.prompts import clean_response
 
+# Fail fast when the server is unreachable. Replies are streamed, so the read timeout
+# bounds the wait for each chunk (the first one includes model load and prompt evaluation)
+_TIMEOUT = httpx.Timeout(300.0, connect=5.0)
+
 
 class OllamaSummarizer(Summarizer):
     """Summarizes transcripts using a local Ollama model."""
@@ -15,24 +20,33 @@ class OllamaSummarizer(Summarizer):
     def __init__(self, config: SummarizationConfig, templates: dict | None = None) -> None:
         self._config = config
         self._templates = templates or {}
-        self._client = ollama.Client(host=config.host)
+        self._client = ollama.Client(host=config.host, timeout=_TIMEOUT)
 
-    def chat(
-        self, system_prompt: str, user_prompt: str,
-        json_mode: bool = False, json_schema: dict | None = None,
-    ) -> str:
-        kwargs = {}
-        if json_mode:
-            kwargs["format"] = "json"
-        response = self._client.chat(
+    def _complete(self, system_prompt: str, user_prompt: str, **kwargs) -> str:
+        """Run a chat request, streaming the reply and cleaning it once complete.
+
+        Streaming keeps the connection active while a slow local model generates
+        long output, instead of idling until the whole reply is ready.
+        """
+        stream = self._client.chat(
             model=self._config.model,
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt},
             ],
+            stream=True,
             **kwargs,
         )
-        return clean_response(response["message"]["content"])
+        return clean_response("".join(part["message"]["content"] for part in stream))
+
+    def chat(
+        self, system_prompt: str, user_prompt: str,
+        json_mode: bool = False, json_schema: dict | None = None,
+    ) -> str:
+        kwargs = {}
+        if json_mode:
+            kwargs["format"] = "json"
+        return self._complete(system_prompt, user_prompt, **kwargs)
 
     def is_available(self) -> bool:
         try:
@@ -46,24 +60,9 @@ class OllamaSummarizer(Summarizer):
 
         system, prompt = resolve_template(self._config.template, self._templates)
         user = prompt.format(transcript=transcript_text)
-
-        response = self._client.chat(
-            model=self._config.model,
-            messages=[
-                {"role": "system", "content": system},
-                {"role": "user", "content": user},
-            ],
-        )
-        return clean_response(response["message"]["content"])
+        return self._complete(system, user)
 
     def generate_title(self, summary_text: str) -> str:
         from ownscribe.summarization.prompts import TITLE_PROMPT, TITLE_SYSTEM
 
-        response = self._client.chat(
-            model=self._config.model,
-            messages=[
-                {"role": "system", "content": TITLE_SYSTEM},
-                {"role": "user", "content": TITLE_PROMPT.format(summary=summary_text)},
-            ],
-        )
-        return clean_response(response["message"]["content"]).strip()
+        return self._complete(TITLE_SYSTEM, TITLE_PROMPT.format(summary=summary_text)).strip()
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import httpx
 import openai
 
 from ownscribe.config import SummarizationConfig
 from ownscribe.summarization.base import Summarizer
 from ownscribe.summarization.prompts import clean_response
 
+# Fail fast when the server is unreachable, but give a slow local model the client's
+# usual 600 s to produce the whole (non-streamed) reply
+_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+
 
 class OpenAISummarizer(Summarizer):
     """Summarizes transcripts using an OpenAI-compatible API."""
@@ -19,7 +24,7 @@ class OpenAISummarizer(Summarizer):
         base_url = config.host
         if not base_url.endswith("/v1"):
             base_url = base_url.rstrip("/") + "/v1"
-        self._client = openai.OpenAI(base_url=base_url, api_key="not-needed")
+        self._client = openai.OpenAI(base_url=base_url, api_key="not-needed", timeout=_TIMEOUT)
 
     def chat(
         self, system_prompt: str, user_prompt: str,
@@ -56,7 +61,8 @@ class OpenAISummarizer(Summarizer):
 
     def is_available(self) -> bool:
         try:
-            self._client.models.list()
+            # A probe should fail fast: the client's default retries back off for over a second
+            self._client.with_options(max_retries=0).models.list()
             return True
         except Exception:
             return False
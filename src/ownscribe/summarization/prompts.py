@@ -2,18 +2,41 @@
 
 from __future__ import annotations
 
-import re
+import string
 
-_THINK_RE = re.compile(r"<think>[\s\S]*?</think>\s*", re.IGNORECASE)
-_ORPHAN_THINK_CLOSE_RE = re.compile(r"^[\s\S]*?</think>\s*", re.IGNORECASE)
+_OPEN_TAG = "<think>"
+_CLOSE_TAG = "</think>"
+# ASCII-only lowering keeps every index aligned with the original text (str.lower() may not)
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
 
 
 def clean_response(text: str) -> str:
     """Strip reasoning/thinking tags from LLM responses."""
-    text = _THINK_RE.sub("", text).strip()
-    if "</think>" in text.lower():
-        text = _ORPHAN_THINK_CLOSE_RE.sub("", text).strip()
-    return text
+    # Every removal needs a closing tag; most responses have none
+    if "</" not in text:
+        return text.strip()
+
+    # Drop each <think>...</think> block and the whitespace after it
+    lowered = text.translate(_ASCII_LOWER)
+    parts: list[str] = []
+    pos = 0
+    while (start := lowered.find(_OPEN_TAG, pos)) != -1:
+        end = lowered.find(_CLOSE_TAG, start + len(_OPEN_TAG))
+        if end == -1:
+            break
+        parts.append(text[pos:start].lstrip() if parts else text[:start])
+        pos = end + len(_CLOSE_TAG)
+    if parts:
+        parts.append(text[pos:].lstrip())
+        text = "".join(parts)
+        lowered = text.translate(_ASCII_LOWER)
+
+    # Orphaned close (the opening tag was swallowed by the chat template): keep what follows it
+    close = lowered.find(_CLOSE_TAG)
+    if close != -1:
+        text = text[close + len(_CLOSE_TAG) :]
+    return text.strip()
+
 
 MEETING_SUMMARY_SYSTEM = (
     "You are a meeting notes assistant. You produce clear, structured summaries of meeting transcripts."
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Word:
     text: str
     start: float
@@ -14,7 +14,7 @@ class Word:
     score: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Segment:
     text: str
     start: float
@@ -23,7 +23,7 @@ class Segment:
     words: list[Word] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptResult:
     segments: list[Segment]
     language: str = ""
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import logging
 import os
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
@@ -17,6 +19,167 @@ from ownscribe.transcription.models import Segment, TranscriptResult, Word
 
 _SAMPLE_RATE = 16000
 
+# Voice activity detection: only speech regions, merged into chunks of at most
+# _CHUNK_SIZE seconds, are sent through the whisper encoder
+_VAD_OPTIONS = {"vad_onset": 0.500, "vad_offset": 0.363}
+_CHUNK_SIZE = 30
+
+# Sink for stray output from whisperx / pyannote / lightning, shared for the process lifetime
+_DEVNULL = open(os.devnull, "w")  # noqa: SIM115
+
+
+# Libraries whose warnings are pure noise for CLI users
+_NOISY_MODULES = (
+    r"(whisperx|faster_whisper|ctranslate2|pyannote|speechbrain|torch|torchaudio|"
+    r"lightning|pytorch_lightning|lightning_fabric|transformers|huggingface_hub)(\.|$)"
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _silence_libraries() -> None:
+    """Register warning filters and logger levels for the ML stack once per process."""
+    warnings.filterwarnings("ignore", module=_NOISY_MODULES)
+    # Suppress named loggers that bypass root (whisperx has propagate=False)
+    for name in ("whisperx", "lightning", "pytorch_lightning"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+
+@functools.lru_cache(maxsize=1)
+def _ffmpeg_path() -> str | None:
+    """Locate ffmpeg on PATH once per process."""
+    import shutil
+
+    return shutil.which("ffmpeg")
+
+
+@functools.lru_cache(maxsize=1)
+def _diarization_deps():
+    """Import the diarization stack once per process (kept out of module import for fast CLI startup)."""
+    import torch
+    from whisperx.diarize import DiarizationPipeline
+
+    return torch, DiarizationPipeline
+
+
+def _assign_speakers(turns: list[tuple[float, float, str]], result: dict) -> dict:
+    """Label segments and words with the speaker whose turns overlap them most.
+
+    Same rule as ``whisperx.assign_word_speakers``, but without a DataFrame scan
+    per word: turns are sorted by start, so each lookup only touches the turns
+    that can overlap the queried interval.
+    """
+    if not turns:
+        return result
+
+    import numpy as np
+
+    turns = sorted(turns)
+    starts = np.array([t[0] for t in turns])
+    ends = np.array([t[1] for t in turns])
+    speakers = [t[2] for t in turns]
+    max_turn = float((ends - starts).max())
+
+    def best_speaker(start: float, end: float) -> str | None:
+        # Any overlapping turn starts before `end` and no earlier than `start - max_turn`
+        lo = int(np.searchsorted(starts, start - max_turn, side="left"))
+        hi = int(np.searchsorted(starts, end, side="left"))
+        overlap = np.minimum(ends[lo:hi], end) - np.maximum(starts[lo:hi], start)
+        totals: dict[str, float] = {}
+        for i in np.flatnonzero(overlap > 0):
+            speaker = speakers[lo + i]
+            totals[speaker] = totals.get(speaker, 0.0) + float(overlap[i])
+        return max(totals, key=totals.__getitem__) if totals else None
+
+    for seg in result.get("segments", []):
+        speaker = best_speaker(seg["start"], seg["end"])
+        if speaker is not None:
+            seg["speaker"] = speaker
+        for word in seg.get("words", []):
+            if "start" not in word:
+                continue
+            speaker = best_speaker(word["start"], word["end"])
+            if speaker is not None:
+                word["speaker"] = speaker
+
+    return result
+
+
+def _load_audio(audio_path: Path):
+    """Load audio as a 16 kHz mono float32 waveform.
+
+    Anything soundfile can read (including the recorder's 48 kHz stereo WAVs) is
+    decoded in-process, skipping the ffmpeg decode subprocess. Files that are not
+    already 16 kHz mono are downmixed and resampled block by block into the output
+    buffer, so peak memory stays close to the size of the result. Other formats go
+    through whisperx, which decodes and resamples via ffmpeg.
+
+    The result is a contiguous float32 array, so diarization can wrap it in a
+    torch tensor without copying.
+    """
+    import numpy as np
+    import soundfile as sf
+
+    try:
+        f = sf.SoundFile(audio_path)
+    except RuntimeError:
+        import whisperx
+
+        return np.ascontiguousarray(whisperx.load_audio(str(audio_path)), dtype=np.float32)
+
+    with f:
+        if f.samplerate == _SAMPLE_RATE and f.channels == 1:
+            return f.read(dtype="float32")
+        return _read_resampled(f)
+
+
+# Input frames decoded per block, and extra frames read on each side of a block so
+# the resampling filter sees the real neighbouring samples instead of zero padding
+_BLOCK_FRAMES = 1 << 19
+_RESAMPLE_CONTEXT = 1024
+
+
+def _read_resampled(f):
+    """Decode an open ``soundfile.SoundFile`` block-wise into 16 kHz mono float32.
+
+    Blocks and their context start on multiples of the resampling period, so each
+    block's output lines up exactly with the corresponding slice of a whole-file
+    resample.
+    """
+    import math
+
+    import numpy as np
+
+    sample_rate, total = f.samplerate, f.frames
+    g = math.gcd(sample_rate, _SAMPLE_RATE)
+    in_period, out_period = sample_rate // g, _SAMPLE_RATE // g
+    context = math.ceil(_RESAMPLE_CONTEXT / in_period) * in_period
+    block = max(1, _BLOCK_FRAMES // in_period) * in_period
+
+    if sample_rate != _SAMPLE_RATE:
+        import torch
+        import torchaudio.functional as AF
+
+    out = np.empty(math.ceil(total * out_period / in_period), dtype=np.float32)
+    for start in range(0, total, block):
+        lo = max(0, start - context)
+        hi = min(total, start + block + context)
+        f.seek(lo)
+        chunk = f.read(hi - lo, dtype="float32", always_2d=True)
+        chunk = chunk.mean(axis=1, dtype=np.float32) if chunk.shape[1] > 1 else chunk[:, 0]
+        if sample_rate != _SAMPLE_RATE:
+            chunk = AF.resample(
+                torch.from_numpy(np.ascontiguousarray(chunk)),
+                sample_rate,
+                _SAMPLE_RATE,
+                resampling_method="sinc_interp_kaiser",
+            ).numpy()
+
+        out_start = start // in_period * out_period
+        skip = (start - lo) // in_period * out_period
+        count = min(block // in_period * out_period, len(out) - out_start)
+        out[out_start : out_start + count] = chunk[skip : skip + count]
+    return out
+
 
 class WhisperXTranscriber(Transcriber):
     """Transcribes audio using WhisperX (faster-whisper + optional pyannote diarization)."""
@@ -42,12 +205,11 @@ class WhisperXTranscriber(Transcriber):
             device,
             compute_type=compute_type,
             language=self._tx_config.language or None,
+            vad_options=_VAD_OPTIONS,
         )
 
     def transcribe(self, audio_path: Path) -> TranscriptResult:
-        import shutil
-
-        if not shutil.which("ffmpeg"):
+        if not _ffmpeg_path():
             click.echo(
                 "Error: ffmpeg is not installed. WhisperX requires ffmpeg for audio decoding.\n"
                 "Install with: brew install ffmpeg",
@@ -73,12 +235,8 @@ class WhisperXTranscriber(Transcriber):
             )
 
         # Suppress all noise from whisperx / pyannote / torch / lightning
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            # Suppress named loggers that bypass root (whisperx has propagate=False)
-            for name in ("whisperx", "lightning", "pytorch_lightning"):
-                logging.getLogger(name).setLevel(logging.WARNING)
-            result = self._transcribe_inner(audio_path)
+        _silence_libraries()
+        result = self._transcribe_inner(audio_path)
 
         if hf_token_warning:
             click.echo(hf_token_warning, err=True)
@@ -90,61 +248,75 @@ class WhisperXTranscriber(Transcriber):
 
         progress = self._progress
 
-        devnull = open(os.devnull, "w")  # noqa: SIM115
-        try:
-            # Outer redirect: catch all stray print() from pyannote/lightning
-            with contextlib.redirect_stdout(devnull):
-                progress.begin("transcribing")
-
-                if self._model is None:
-                    with contextlib.redirect_stderr(devnull):
-                        self._load_model()
+        # Diarization assigns speakers per word, so it needs alignment too
+        align = self._tx_config.word_timestamps or bool(
+            self._diar_config and self._diar_config.enabled
+        )
 
-                audio = whisperx.load_audio(str(audio_path))
+        # One redirect for the whole run: the writer turns transcribe/align progress
+        # lines into bar updates and drops every other stray print()
+        writer = ProgressWriter(
+            lambda frac: progress.update("transcribing", frac),
+            offset=0.0, scale=0.5 if align else 1.0,
+        )
 
-                tx_writer = ProgressWriter(
-                    lambda frac: progress.update("transcribing", frac),
-                    offset=0.0, scale=0.5,
-                )
-                align_writer = ProgressWriter(
-                    lambda frac: progress.update("transcribing", frac),
-                    offset=0.5, scale=0.5,
+        with contextlib.redirect_stdout(writer), ThreadPoolExecutor(max_workers=2) as pool:
+            progress.begin("transcribing")
+
+            # Load the model in the background while the audio is decoded
+            if self._model is None:
+                with contextlib.redirect_stderr(_DEVNULL):
+                    model_future = pool.submit(self._load_model)
+                    audio = _load_audio(audio_path)
+                    model_future.result()
+            else:
+                audio = _load_audio(audio_path)
+
+            # With a fixed language the align model can load during transcription
+            align_future = None
+            if align and self._tx_config.language:
+                align_future = pool.submit(
+                    whisperx.load_align_model, language_code=self._tx_config.language, device="cpu"
                 )
 
-                # Nested redirect overrides devnull → captures progress
-                with contextlib.redirect_stdout(tx_writer):
-                    result = self._model.transcribe(
-                        audio, batch_size=16, print_progress=True, combined_progress=True
-                    )
+            result = self._model.transcribe(
+                audio,
+                batch_size=16,
+                chunk_size=_CHUNK_SIZE,
+                print_progress=True,
+                combined_progress=True,
+            )
 
-                language = result.get("language", "")
+            language = result.get("language", "")
 
-                align_model, align_metadata = whisperx.load_align_model(
-                    language_code=language, device="cpu"
-                )
-                with contextlib.redirect_stdout(align_writer):
-                    result = whisperx.align(
-                        result["segments"],
-                        align_model,
-                        align_metadata,
-                        audio,
-                        device="cpu",
-                        return_char_alignments=False,
-                        print_progress=True,
-                        combined_progress=True,
+            if align:
+                if align_future is not None and language == self._tx_config.language:
+                    align_model, align_metadata = align_future.result()
+                else:
+                    align_model, align_metadata = whisperx.load_align_model(
+                        language_code=language, device="cpu"
                     )
+                writer.set_phase(offset=0.5, scale=0.5)
+                result = whisperx.align(
+                    result["segments"],
+                    align_model,
+                    align_metadata,
+                    audio,
+                    device="cpu",
+                    return_char_alignments=False,
+                    print_progress=True,
+                    combined_progress=True,
+                )
 
-                progress.complete("transcribing")
+            progress.complete("transcribing")
 
-                # --- Optional diarization ---
-                if (
-                    self._diar_config
-                    and self._diar_config.enabled
-                    and self._diar_config.hf_token
-                ):
-                    result = self._diarize(audio, result, devnull)
-        finally:
-            devnull.close()
+            # --- Optional diarization ---
+            if (
+                self._diar_config
+                and self._diar_config.enabled
+                and self._diar_config.hf_token
+            ):
+                result = self._diarize(audio, result)
 
         # --- Convert to our data models ---
         segments = []
@@ -181,11 +353,8 @@ class WhisperXTranscriber(Transcriber):
             return "mps" if torch.backends.mps.is_available() else "cpu"
         return device_cfg
 
-    def _diarize(self, audio, result, devnull):
-        import pandas as pd
-        import torch
-        import whisperx
-        from whisperx.diarize import DiarizationPipeline
+    def _diarize(self, audio, result):
+        torch, DiarizationPipeline = _diarization_deps()
 
         progress = self._progress
         progress.begin("diarizing")
@@ -193,14 +362,18 @@ class WhisperXTranscriber(Transcriber):
         device = self._resolve_diarization_device(self._diar_config.device)
 
         # Load the diarization pipeline (model loading happens inside)
-        with contextlib.redirect_stderr(devnull):
+        with contextlib.redirect_stderr(_DEVNULL):
             diarize_model = DiarizationPipeline(
                 use_auth_token=self._diar_config.hf_token, device=device
             )
 
-        # Build audio_data dict the same way whisperx does internally
+        # Build audio_data dict the same way whisperx does internally.
+        # from_numpy shares the buffer; unsqueeze_ adds the channel axis in place.
+        waveform = torch.from_numpy(audio).unsqueeze_(0)
+        if device == "cuda":
+            waveform = waveform.pin_memory()
         audio_data = {
-            "waveform": torch.from_numpy(audio[None, :]),
+            "waveform": waveform,
             "sample_rate": _SAMPLE_RATE,
         }
 
@@ -211,18 +384,15 @@ class WhisperXTranscriber(Transcriber):
             diarize_kwargs["max_speakers"] = self._diar_config.max_speakers
 
         # Call pyannote pipeline directly with progress hook
-        diarization = diarize_model.model(
-            audio_data, hook=progress.diarization_hook, **diarize_kwargs
-        )
+        with torch.inference_mode():
+            diarization = diarize_model.model(
+                audio_data, hook=progress.diarization_hook, **diarize_kwargs
+            )
 
         progress.complete("diarizing")
 
-        # Convert to DataFrame (replicating whisperx/diarize.py logic)
-        diarize_df = pd.DataFrame(
-            diarization.itertracks(yield_label=True),
-            columns=["segment", "label", "speaker"],
-        )
-        diarize_df["start"] = diarize_df["segment"].apply(lambda x: x.start)
-        diarize_df["end"] = diarize_df["segment"].apply(lambda x: x.end)
-
-        return whisperx.assign_word_speakers(diarize_df, result)
+        turns = [
+            (turn.start, turn.end, speaker)
+            for turn, _track, speaker in diarization.itertracks(yield_label=True)
+        ]
+        return _assign_speakers(turns, result)
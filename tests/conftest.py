@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-import math
+import json
 import os
-import struct
 import sys
 import tempfile
 import wave
@@ -50,21 +49,31 @@ def tmp_config_file(tmp_path):
     return config_toml
 
 
+@pytest.fixture
+def ollama_chat_response():
+    """Build a mock Ollama /api/chat reply streamed the way the server does: one JSON object per line."""
+    from werkzeug import Response
+
+    def build(*chunks: dict) -> Response:
+        body = "".join(json.dumps(chunk) + "\n" for chunk in chunks)
+        return Response(body, content_type="application/x-ndjson")
+
+    return build
+
+
 @pytest.fixture
 def synthetic_wav() -> Path:
     """Generate a 0.5s 440Hz sine wave WAV file (16-bit PCM, 16kHz mono)."""
+    import numpy as np
+
     sample_rate = 16000
     duration = 0.5
     frequency = 440.0
     n_samples = int(sample_rate * duration)
 
-    samples = []
-    for i in range(n_samples):
-        t = i / sample_rate
-        value = int(32767 * 0.5 * math.sin(2 * math.pi * frequency * t))
-        samples.append(struct.pack("<h", value))
-
-    raw = b"".join(samples)
+    t = np.arange(n_samples, dtype=np.float64) / sample_rate
+    samples = (32767 * 0.5 * np.sin(2 * np.pi * frequency * t)).astype("<i2")
+    raw = samples.tobytes()
 
     fd, path = tempfile.mkstemp(suffix=".wav")
     os.close(fd)
@@ -80,12 +89,19 @@ def synthetic_wav() -> Path:
     Path(path).unlink(missing_ok=True)
 
 
+_IN_CI = os.environ.get("CI", "").lower() in ("true", "1", "yes")
+_IS_DARWIN = sys.platform == "darwin"
+
+
 def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
     """Auto-skip tests based on platform and environment."""
-    in_ci = os.environ.get("CI", "").lower() in ("true", "1", "yes")
+    skip_hardware = pytest.mark.skip(reason="hardware tests disabled in CI") if _IN_CI else None
+    skip_macos = None if _IS_DARWIN else pytest.mark.skip(reason="macOS-only test")
+    if skip_hardware is None and skip_macos is None:
+        return
 
     for item in items:
-        if "hardware" in item.keywords and in_ci:
-            item.add_marker(pytest.mark.skip(reason="hardware tests disabled in CI"))
-        if "macos" in item.keywords and sys.platform != "darwin":
-            item.add_marker(pytest.mark.skip(reason="macOS-only test"))
+        if skip_hardware and "hardware" in item.keywords:
+            item.add_marker(skip_hardware)
+        if skip_macos and "macos" in item.keywords:
+            item.add_marker(skip_macos)
@@ -4,10 +4,17 @@ from __future__ import annotations
 
 from unittest import mock
 
+import pytest
 from click.testing import CliRunner
 
 from ownscribe.cli import cli
-from ownscribe.config import Config
+from ownscribe.config import DATA_DIR, Config, SummarizationConfig
+from ownscribe.summarization.cache import CACHE_DIR, CachingSummarizer
+
+
+@pytest.fixture(scope="module")
+def runner() -> CliRunner:
+    return CliRunner()
 
 
 def _mock_config(config: Config | None = None):
@@ -16,30 +23,26 @@ def _mock_config(config: Config | None = None):
 
 
 class TestMainCommand:
-    def test_help(self):
-        runner = CliRunner()
+    def test_help(self, runner):
         result = runner.invoke(cli, ["--help"])
         assert result.exit_code == 0
         assert "Fully local meeting transcription and summarization" in result.output
 
-    def test_no_summarize_flag(self):
-        runner = CliRunner()
+    def test_no_summarize_flag(self, runner):
         with _mock_config(), mock.patch("ownscribe.pipeline.run_pipeline") as mock_run:
             result = runner.invoke(cli, ["--no-summarize"])
             assert result.exit_code == 0
             config = mock_run.call_args[0][0]
             assert config.summarization.enabled is False
 
-    def test_mic_flag(self):
-        runner = CliRunner()
+    def test_mic_flag(self, runner):
         with _mock_config(), mock.patch("ownscribe.pipeline.run_pipeline") as mock_run:
             result = runner.invoke(cli, ["--mic"])
             assert result.exit_code == 0
             config = mock_run.call_args[0][0]
             assert config.audio.mic is True
 
-    def test_device_flag(self):
-        runner = CliRunner()
+    def test_device_flag(self, runner):
         with _mock_config(), mock.patch("ownscribe.pipeline.run_pipeline") as mock_run:
             result = runner.invoke(cli, ["--device", "USB Mic"])
             assert result.exit_code == 0
@@ -47,16 +50,14 @@ class TestMainCommand:
             assert config.audio.device == "USB Mic"
             assert config.audio.backend == "sounddevice"
 
-    def test_model_flag(self):
-        runner = CliRunner()
+    def test_model_flag(self, runner):
         with _mock_config(), mock.patch("ownscribe.pipeline.run_pipeline") as mock_run:
             result = runner.invoke(cli, ["--model", "large-v3"])
             assert result.exit_code == 0
             config = mock_run.call_args[0][0]
             assert config.transcription.model == "large-v3"
 
-    def test_language_flag(self):
-        runner = CliRunner()
+    def test_language_flag(self, runner):
         with _mock_config(), mock.patch("ownscribe.pipeline.run_pipeline") as mock_run:
             result = runner.invoke(cli, ["--language", "de"])
             assert result.exit_code == 0
@@ -65,54 +66,46 @@ class TestMainCommand:
 
 
 class TestSubcommandHelp:
-    def test_transcribe_help(self):
-        runner = CliRunner()
+    def test_transcribe_help(self, runner):
         result = runner.invoke(cli, ["transcribe", "--help"])
         assert result.exit_code == 0
         assert "Transcribe an audio file" in result.output
 
-    def test_summarize_help(self):
-        runner = CliRunner()
+    def test_summarize_help(self, runner):
         result = runner.invoke(cli, ["summarize", "--help"])
         assert result.exit_code == 0
         assert "Summarize a transcript file" in result.output
 
-    def test_devices_help(self):
-        runner = CliRunner()
+    def test_devices_help(self, runner):
         result = runner.invoke(cli, ["devices", "--help"])
         assert result.exit_code == 0
         assert "List available audio input devices" in result.output
 
-    def test_config_help(self):
-        runner = CliRunner()
+    def test_config_help(self, runner):
         result = runner.invoke(cli, ["config", "--help"])
         assert result.exit_code == 0
         assert "Open the configuration file" in result.output
 
-    def test_resume_help(self):
-        runner = CliRunner()
+    def test_resume_help(self, runner):
         result = runner.invoke(cli, ["resume", "--help"])
         assert result.exit_code == 0
         assert "Resume a partially-completed pipeline" in result.output
 
-    def test_cleanup_help(self):
-        runner = CliRunner()
+    def test_cleanup_help(self, runner):
         result = runner.invoke(cli, ["cleanup", "--help"])
         assert result.exit_code == 0
         assert "Remove ownscribe data from disk" in result.output
 
 
 class TestKeepRecordingFlag:
-    def test_keep_recording_flag(self):
-        runner = CliRunner()
+    def test_keep_recording_flag(self, runner):
         with _mock_config(), mock.patch("ownscribe.pipeline.run_pipeline") as mock_run:
             result = runner.invoke(cli, ["--no-keep-recording"])
             assert result.exit_code == 0
             config = mock_run.call_args[0][0]
             assert config.output.keep_recording is False
 
-    def test_keep_recording_default_is_true(self):
-        runner = CliRunner()
+    def test_keep_recording_default_is_true(self, runner):
         with _mock_config(), mock.patch("ownscribe.pipeline.run_pipeline") as mock_run:
             result = runner.invoke(cli, [])
             assert result.exit_code == 0
@@ -121,7 +114,7 @@ class TestKeepRecordingFlag:
 
 
 class TestCleanup:
-    def test_all_yes_removes_dirs(self, tmp_path):
+    def test_all_yes_removes_dirs(self, runner, tmp_path):
         config_dir = tmp_path / "config"
         cache_dir = tmp_path / "cache"
         output_dir = tmp_path / "output"
@@ -132,7 +125,6 @@ class TestCleanup:
         cfg = Config()
         cfg.output.dir = str(output_dir)
 
-        runner = CliRunner()
         with (
             _mock_config(cfg),
             mock.patch("ownscribe.cli._CONFIG_DIR", str(config_dir)),
@@ -148,7 +140,21 @@ class TestCleanup:
         assert "Removed Cache" in result.output
         assert "Removed Output" in result.output
 
-    def test_config_only(self, tmp_path):
+    def test_cache_removes_cached_summaries(self, runner, tmp_path):
+        data_dir = tmp_path / "data"
+        config = SummarizationConfig(cache=True)
+        inner = mock.Mock(summarize=mock.Mock(return_value="Summary"))
+        summarizer = CachingSummarizer(inner, config, cache_dir=data_dir / CACHE_DIR.relative_to(DATA_DIR))
+        summarizer.summarize("Alice: Hello")
+        assert any(data_dir.rglob("*.md"))
+
+        with _mock_config(), mock.patch("ownscribe.cli._CACHE_DIR", str(data_dir)):
+            result = runner.invoke(cli, ["cleanup", "--cache", "--yes"])
+
+        assert result.exit_code == 0
+        assert not data_dir.exists()
+
+    def test_config_only(self, runner, tmp_path):
         config_dir = tmp_path / "config"
         cache_dir = tmp_path / "cache"
         output_dir = tmp_path / "output"
@@ -159,7 +165,6 @@ class TestCleanup:
         cfg = Config()
         cfg.output.dir = str(output_dir)
 
-        runner = CliRunner()
         with (
             _mock_config(cfg),
             mock.patch("ownscribe.cli._CONFIG_DIR", str(config_dir)),
@@ -172,11 +177,10 @@ class TestCleanup:
         assert cache_dir.exists()
         assert output_dir.exists()
 
-    def test_skips_missing_dirs(self, tmp_path):
+    def test_skips_missing_dirs(self, runner, tmp_path):
         cfg = Config()
         cfg.output.dir = str(tmp_path / "nonexistent")
 
-        runner = CliRunner()
         with (
             _mock_config(cfg),
             mock.patch("ownscribe.cli._CONFIG_DIR", str(tmp_path / "no-config")),
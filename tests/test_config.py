@@ -19,6 +19,10 @@ class TestDefaults:
         cfg = Config()
         assert cfg.transcription.model == "base"
 
+    def test_default_word_timestamps_off(self):
+        cfg = Config()
+        assert cfg.transcription.word_timestamps is False
+
     def test_default_summarization_enabled(self):
         cfg = Config()
         assert cfg.summarization.enabled is True
@@ -45,6 +49,10 @@ class TestDefaults:
         cfg = Config()
         assert cfg.summarization.template == ""
 
+    def test_default_summarization_cache_off(self):
+        cfg = Config()
+        assert cfg.summarization.cache is False
+
     def test_default_templates_empty(self):
         cfg = Config()
         assert cfg.templates == {}
@@ -2,106 +2,96 @@
 
 from __future__ import annotations
 
+import copy
 import signal
-from unittest import mock
 
+import pytest
+
+from ownscribe.audio import coreaudio
 from ownscribe.audio.base import AudioRecorder
 
+_SIGUSR1 = signal.SIGUSR1
 
-class TestBaseClassMuteDefaults:
-    """Base class provides no-op mute methods."""
 
-    def test_toggle_mute_is_noop(self):
-        # Create a concrete subclass to test the base defaults
-        class DummyRecorder(AudioRecorder):
-            def start(self, output_path):
-                pass
+class DummyRecorder(AudioRecorder):
+    """Minimal concrete recorder for exercising the base-class defaults."""
 
-            def stop(self):
-                pass
+    def start(self, output_path):
+        pass
 
-            def is_available(self):
-                return True
+    def stop(self):
+        pass
 
-        recorder = DummyRecorder()
-        recorder.toggle_mute()  # should not raise
+    def is_available(self):
+        return True
 
-    def test_is_muted_returns_false(self):
-        class DummyRecorder(AudioRecorder):
-            def start(self, output_path):
-                pass
 
-            def stop(self):
-                pass
+class TestBaseClassMuteDefaults:
+    """Base class provides no-op mute methods."""
 
-            def is_available(self):
-                return True
+    def test_toggle_mute_is_noop(self):
+        recorder = DummyRecorder()
+        recorder.toggle_mute()  # should not raise
 
+    def test_is_muted_returns_false(self):
         recorder = DummyRecorder()
         assert recorder.is_muted is False
 
 
-class TestCoreAudioRecorderMute:
-    """CoreAudioRecorder sends SIGUSR1 and tracks mute state."""
-
-    def _make_recorder(self, mic: bool = True) -> object:
-        from ownscribe.audio.coreaudio import CoreAudioRecorder
-
-        with mock.patch("ownscribe.audio.coreaudio._find_binary", return_value=None):
-            return CoreAudioRecorder(mic=mic)
-
-    def test_toggle_mute_sends_sigusr1(self):
-        recorder = self._make_recorder(mic=True)
-        proc = mock.MagicMock()
-        proc.poll.return_value = None  # process running
-        recorder._process = proc
+class _FakeProc:
+    """Stand-in for the helper's Popen: reports liveness and records signals."""
 
-        recorder.toggle_mute()
+    def __init__(self, alive: bool = True) -> None:
+        self.alive = alive
+        self.signals: list[int] = []
 
-        proc.send_signal.assert_called_once_with(signal.SIGUSR1)
-        assert recorder.is_muted is True
+    def poll(self) -> int | None:
+        return None if self.alive else 0
 
-    def test_toggle_mute_twice_unmutes(self):
-        recorder = self._make_recorder(mic=True)
-        proc = mock.MagicMock()
-        proc.poll.return_value = None
-        recorder._process = proc
+    def send_signal(self, sig: int) -> None:
+        self.signals.append(sig)
 
-        recorder.toggle_mute()
-        assert recorder.is_muted is True
-
-        recorder.toggle_mute()
-        assert recorder.is_muted is False
-        assert proc.send_signal.call_count == 2
-
-    def test_toggle_mute_noop_without_mic(self):
-        recorder = self._make_recorder(mic=False)
-        proc = mock.MagicMock()
-        proc.poll.return_value = None
-        recorder._process = proc
 
-        recorder.toggle_mute()
+@pytest.fixture(scope="module")
+def base_recorders() -> dict[bool, object]:
+    """One CoreAudioRecorder per mic setting, built once with binary lookup disabled."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(coreaudio, "_find_binary", lambda: None)
+        return {mic: coreaudio.CoreAudioRecorder(mic=mic) for mic in (True, False)}
 
-        proc.send_signal.assert_not_called()
-        assert recorder.is_muted is False
 
-    def test_toggle_mute_noop_without_process(self):
-        recorder = self._make_recorder(mic=True)
-        # _process is None (not started)
+class TestCoreAudioRecorderMute:
+    """CoreAudioRecorder sends SIGUSR1 and tracks mute state."""
 
-        recorder.toggle_mute()  # should not raise
-        assert recorder.is_muted is False
+    @pytest.fixture(autouse=True)
+    def _bind_recorders(self, base_recorders):
+        self._base_recorders = base_recorders
 
-    def test_toggle_mute_noop_when_process_exited(self):
-        recorder = self._make_recorder(mic=True)
-        proc = mock.MagicMock()
-        proc.poll.return_value = 0  # process exited
+    def _make_recorder(self, mic: bool = True) -> object:
+        return copy.copy(self._base_recorders[mic])
+
+    @pytest.mark.parametrize(
+        ("mic", "proc_state", "toggles", "expected_signals", "expected_muted"),
+        [
+            (True, "running", 1, 1, True),
+            (True, "running", 2, 2, False),  # second toggle unmutes
+            (False, "running", 1, 0, False),  # no mic, nothing to mute
+            (True, None, 1, 0, False),  # not started
+            (True, "exited", 1, 0, False),
+        ],
+        ids=["mute", "mute-unmute", "no-mic", "no-process", "exited"],
+    )
+    def test_toggle_mute(self, mic, proc_state, toggles, expected_signals, expected_muted):
+        recorder = self._make_recorder(mic=mic)
+        proc = None if proc_state is None else _FakeProc(alive=proc_state == "running")
         recorder._process = proc
 
-        recorder.toggle_mute()
+        for _ in range(toggles):
+            recorder.toggle_mute()  # should not raise
 
-        proc.send_signal.assert_not_called()
-        assert recorder.is_muted is False
+        if proc is not None:
+            assert proc.signals == [_SIGUSR1] * expected_signals
+        assert recorder.is_muted is expected_muted
 
     def test_is_muted_default_false(self):
         recorder = self._make_recorder(mic=True)
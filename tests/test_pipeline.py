@@ -4,67 +4,70 @@ from __future__ import annotations
 
 import contextlib
 import json
+from pathlib import Path
+from types import SimpleNamespace
 from unittest import mock
 
+import pytest
+
 from ownscribe.config import Config
+from ownscribe.pipeline import (
+    _create_recorder,
+    _do_transcribe_and_summarize,
+    _format_output,
+    _generate_title_slug,
+    _slugify,
+    run_resume,
+    run_summarize,
+    run_transcribe,
+)
 from ownscribe.transcription.models import Segment, TranscriptResult
 
 
-class TestCreateRecorder:
-    def test_coreaudio_when_available(self):
-        from ownscribe.pipeline import _create_recorder
+@pytest.fixture
+def config() -> Config:
+    """Fresh default config; constructing one is cheaper than deep-copying a prototype."""
+    return Config()
+
 
-        config = Config()
+class TestCreateRecorder:
+    def test_coreaudio_when_available(self, config, monkeypatch):
         config.audio.backend = "coreaudio"
         config.audio.device = ""
 
-        with mock.patch("ownscribe.audio.coreaudio.CoreAudioRecorder") as mock_cls:
-            mock_cls.return_value.is_available.return_value = True
-            recorder = _create_recorder(config)
-            assert recorder == mock_cls.return_value
-
-    def test_fallback_to_sounddevice(self):
-        from ownscribe.pipeline import _create_recorder
+        coreaudio = SimpleNamespace(is_available=lambda: True)
+        monkeypatch.setattr("ownscribe.audio.coreaudio.CoreAudioRecorder", lambda **kw: coreaudio)
+        assert _create_recorder(config) is coreaudio
 
-        config = Config()
+    def test_fallback_to_sounddevice(self, config, monkeypatch):
         config.audio.backend = "coreaudio"
         config.audio.device = ""
 
-        with (
-            mock.patch("ownscribe.audio.coreaudio.CoreAudioRecorder") as mock_ca,
-            mock.patch("ownscribe.audio.sounddevice_recorder.SoundDeviceRecorder") as mock_sd,
-        ):
-            mock_ca.return_value.is_available.return_value = False
-            recorder = _create_recorder(config)
-            assert recorder == mock_sd.return_value
-
-    def test_sounddevice_when_device_set(self):
-        from ownscribe.pipeline import _create_recorder
+        sounddevice = SimpleNamespace()
+        monkeypatch.setattr(
+            "ownscribe.audio.coreaudio.CoreAudioRecorder", lambda **kw: SimpleNamespace(is_available=lambda: False)
+        )
+        monkeypatch.setattr("ownscribe.audio.sounddevice_recorder.SoundDeviceRecorder", lambda **kw: sounddevice)
+        assert _create_recorder(config) is sounddevice
 
-        config = Config()
+    def test_sounddevice_when_device_set(self, config, monkeypatch):
         config.audio.backend = "coreaudio"
         config.audio.device = "USB Mic"
 
-        with mock.patch("ownscribe.audio.sounddevice_recorder.SoundDeviceRecorder") as mock_sd:
-            recorder = _create_recorder(config)
-            assert recorder == mock_sd.return_value
+        sounddevice = SimpleNamespace()
+        monkeypatch.setattr("ownscribe.audio.sounddevice_recorder.SoundDeviceRecorder", lambda **kw: sounddevice)
+        assert _create_recorder(config) is sounddevice
 
 
 class TestFormatOutput:
-    def test_markdown_format(self, sample_transcript):
-        from ownscribe.pipeline import _format_output
-
-        config = Config()
+    def test_markdown_format(self, config, sample_transcript):
         config.output.format = "markdown"
 
         transcript_str, summary_str = _format_output(config, sample_transcript)
         assert "# Transcript" in transcript_str
         assert summary_str is None
 
-    def test_markdown_with_summary(self, sample_transcript):
-        from ownscribe.pipeline import _format_output
-
-        config = Config()
+    def test_markdown_with_summary(self, config, sample_transcript):
         config.output.format = "markdown"
 
         transcript_str, summary_str = _format_output(config, sample_transcript, "A great meeting.")
@@ -72,10 +75,7 @@ class TestFormatOutput:
         assert "# Meeting Summary" in summary_str
         assert "A great meeting." in summary_str
 
-    def test_json_format(self, sample_transcript):
-        from ownscribe.pipeline import _format_output
-
-        config = Config()
+    def test_json_format(self, config, sample_transcript):
         config.output.format = "json"
 
         transcript_str, _summary_str = _format_output(config, sample_transcript)
@@ -84,228 +84,160 @@ class TestFormatOutput:
 
 
 class TestSlugify:
-    def test_basic(self):
-        from ownscribe.pipeline import _slugify
-
-        assert _slugify("Q3 Budget Planning Review") == "q3-budget-planning-review"
-
-    def test_strips_special_chars(self):
-        from ownscribe.pipeline import _slugify
-
-        assert _slugify("Hello, World! @#$") == "hello-world"
-
-    def test_truncates_to_max_length(self):
-        from ownscribe.pipeline import _slugify
-
-        result = _slugify("a " * 100, max_length=10)
-        assert len(result) <= 10
-
-    def test_empty_input(self):
-        from ownscribe.pipeline import _slugify
-
-        assert _slugify("") == ""
-
-    def test_colons_removed(self):
-        from ownscribe.pipeline import _slugify
-
-        assert _slugify("Meeting: Budget Review") == "meeting-budget-review"
+    @pytest.mark.parametrize(
+        ("text", "max_length", "expected"),
+        [
+            ("Q3 Budget Planning Review", 50, "q3-budget-planning-review"),
+            ("Hello, World! @#$", 50, "hello-world"),
+            ("a " * 100, 10, "a-a-a-a-a"),
+            ("", 50, ""),
+            ("Meeting: Budget Review", 50, "meeting-budget-review"),
+        ],
+        ids=["basic", "special-chars", "truncated", "empty", "colons"],
+    )
+    def test_slugify(self, text, max_length, expected):
+        result = _slugify(text, max_length=max_length)
+        assert result == expected
+        assert len(result) <= max_length
 
 
 class TestGenerateTitleSlug:
-    def test_returns_slug(self):
-        from ownscribe.pipeline import _generate_title_slug
-
+    @pytest.mark.parametrize(
+        ("title", "error", "expected"),
+        [
+            ("Budget Review", None, "budget-review"),
+            ("!!!", None, ""),  # slugifies to empty
+            (None, Exception("LLM down"), ""),
+        ],
+        ids=["slug", "empty-slug", "llm-failure"],
+    )
+    def test_generate_title_slug(self, title, error, expected):
         mock_summarizer = mock.MagicMock()
-        mock_summarizer.generate_title.return_value = "Budget Review"
+        if error is not None:
+            mock_summarizer.generate_title.side_effect = error
+        else:
+            mock_summarizer.generate_title.return_value = title
 
-        assert _generate_title_slug("summary text", mock_summarizer) == "budget-review"
+        assert _generate_title_slug("summary text", mock_summarizer) == expected
 
-    def test_returns_empty_on_empty_slug(self):
-        from ownscribe.pipeline import _generate_title_slug
 
-        mock_summarizer = mock.MagicMock()
-        mock_summarizer.generate_title.return_value = "!!!"  # slugifies to empty
+@pytest.fixture
+def audio_wav(tmp_path) -> Path:
+    """A stand-in recording inside the meeting's output directory."""
+    path = tmp_path / "recording.wav"
+    path.write_bytes(b"fake audio data")
+    return path
 
-        assert _generate_title_slug("summary", mock_summarizer) == ""
 
-    def test_returns_empty_on_llm_failure(self):
-        from ownscribe.pipeline import _generate_title_slug
-
-        mock_summarizer = mock.MagicMock()
-        mock_summarizer.generate_title.side_effect = Exception("LLM down")
-
-        assert _generate_title_slug("summary", mock_summarizer) == ""
+@pytest.fixture(scope="session")
+def sample_transcript_result() -> TranscriptResult:
+    """Read-only single-segment transcript returned by the stub transcriber."""
+    return TranscriptResult(
+        segments=[Segment(text="Hello world.", start=0.0, end=1.5)],
+        language="en",
+        duration=1.5,
+    )
 
 
+@pytest.mark.slow
 class TestDoTranscribeAndSummarize:
     """Test _do_transcribe_and_summarize with mocked transcriber/summarizer."""
 
-    def _make_transcript(self) -> TranscriptResult:
-        return TranscriptResult(
-            segments=[Segment(text="Hello world.", start=0.0, end=1.5)],
-            language="en",
-            duration=1.5,
-        )
+    @pytest.fixture
+    def stub_transcriber(self, monkeypatch, sample_transcript_result) -> None:
+        transcriber = SimpleNamespace(transcribe=lambda path: sample_transcript_result)
+        monkeypatch.setattr("ownscribe.pipeline._create_transcriber", lambda *a, **kw: transcriber)
 
-    def test_transcribe_only(self, tmp_path):
-        from ownscribe.pipeline import _do_transcribe_and_summarize
+    def _stub_summarizer(self, monkeypatch, *, available: bool = True, summarize=None) -> None:
+        summarizer = SimpleNamespace(
+            is_available=lambda: available,
+            summarize=summarize or (lambda text: "## Summary\nGood meeting."),
+            generate_title=lambda summary: "",
+        )
+        monkeypatch.setattr("ownscribe.pipeline.create_summarizer", lambda config: summarizer)
 
-        config = Config()
+    def test_transcribe_only(self, config, tmp_path, audio_wav, stub_transcriber):
         config.output.format = "markdown"
-        audio_path = tmp_path / "recording.wav"
-        audio_path.touch()
 
-        mock_transcriber = mock.MagicMock()
-        mock_transcriber.transcribe.return_value = self._make_transcript()
-
-        with mock.patch("ownscribe.pipeline._create_transcriber", return_value=mock_transcriber):
-            _do_transcribe_and_summarize(config, audio_path, tmp_path, summarize=False)
+        _do_transcribe_and_summarize(config, audio_wav, tmp_path, summarize=False)
 
         assert (tmp_path / "transcript.md").exists()
         assert not (tmp_path / "summary.md").exists()
 
-    def test_transcribe_and_summarize(self, tmp_path):
-        from ownscribe.pipeline import _do_transcribe_and_summarize
-
-        config = Config()
+    def test_transcribe_and_summarize(self, config, tmp_path, audio_wav, monkeypatch, stub_transcriber):
         config.output.format = "markdown"
         config.summarization.enabled = True
-        audio_path = tmp_path / "recording.wav"
-        audio_path.touch()
-
-        mock_transcriber = mock.MagicMock()
-        mock_transcriber.transcribe.return_value = self._make_transcript()
 
-        mock_summarizer = mock.MagicMock()
-        mock_summarizer.is_available.return_value = True
-        mock_summarizer.summarize.return_value = "## Summary\nGood meeting."
-
-        with (
-            mock.patch("ownscribe.pipeline._create_transcriber", return_value=mock_transcriber),
-            mock.patch("ownscribe.pipeline.create_summarizer", return_value=mock_summarizer),
-        ):
-            _do_transcribe_and_summarize(config, audio_path, tmp_path, summarize=True)
+        self._stub_summarizer(monkeypatch)
+        _do_transcribe_and_summarize(config, audio_wav, tmp_path, summarize=True)
 
         assert (tmp_path / "transcript.md").exists()
         assert (tmp_path / "summary.md").exists()
         assert "Summary" in (tmp_path / "summary.md").read_text()
 
-    def test_summarizer_unavailable_skips_gracefully(self, tmp_path):
-        from ownscribe.pipeline import _do_transcribe_and_summarize
-
-        config = Config()
+    def test_summarizer_unavailable_skips_gracefully(self, config, tmp_path, audio_wav, monkeypatch, stub_transcriber):
         config.output.format = "markdown"
         config.summarization.enabled = True
-        audio_path = tmp_path / "recording.wav"
-        audio_path.touch()
 
-        mock_transcriber = mock.MagicMock()
-        mock_transcriber.transcribe.return_value = self._make_transcript()
-
-        mock_summarizer = mock.MagicMock()
-        mock_summarizer.is_available.return_value = False
-
-        with (
-            mock.patch("ownscribe.pipeline._create_transcriber", return_value=mock_transcriber),
-            mock.patch("ownscribe.pipeline.create_summarizer", return_value=mock_summarizer),
-        ):
-            _do_transcribe_and_summarize(config, audio_path, tmp_path, summarize=True)
+        self._stub_summarizer(monkeypatch, available=False)
+        _do_transcribe_and_summarize(config, audio_wav, tmp_path, summarize=True)
 
         assert (tmp_path / "transcript.md").exists()
         assert not (tmp_path / "summary.md").exists()
 
-    def test_json_output_format(self, tmp_path):
-        from ownscribe.pipeline import _do_transcribe_and_summarize
-
-        config = Config()
+    def test_json_output_format(self, config, tmp_path, audio_wav, stub_transcriber):
         config.output.format = "json"
-        audio_path = tmp_path / "recording.wav"
-        audio_path.touch()
-
-        mock_transcriber = mock.MagicMock()
-        mock_transcriber.transcribe.return_value = self._make_transcript()
 
-        with mock.patch("ownscribe.pipeline._create_transcriber", return_value=mock_transcriber):
-            _do_transcribe_and_summarize(config, audio_path, tmp_path, summarize=False)
+        _do_transcribe_and_summarize(config, audio_wav, tmp_path, summarize=False)
 
         assert (tmp_path / "transcript.json").exists()
         assert not (tmp_path / "transcript.md").exists()
 
-    def test_keep_recording_false_deletes_wav(self, tmp_path):
-        from ownscribe.pipeline import _do_transcribe_and_summarize
-
-        config = Config()
+    def test_keep_recording_false_deletes_wav(self, config, tmp_path, audio_wav, stub_transcriber):
         config.output.format = "markdown"
         config.output.keep_recording = False
-        audio_path = tmp_path / "recording.wav"
-        audio_path.write_bytes(b"fake audio data")
 
-        mock_transcriber = mock.MagicMock()
-        mock_transcriber.transcribe.return_value = self._make_transcript()
-
-        with mock.patch("ownscribe.pipeline._create_transcriber", return_value=mock_transcriber):
-            _do_transcribe_and_summarize(config, audio_path, tmp_path, summarize=False)
+        _do_transcribe_and_summarize(config, audio_wav, tmp_path, summarize=False)
 
         assert (tmp_path / "transcript.md").exists()
-        assert not audio_path.exists()
-
-    def test_keep_recording_true_keeps_wav(self, tmp_path):
-        from ownscribe.pipeline import _do_transcribe_and_summarize
+        assert not audio_wav.exists()
 
-        config = Config()
+    def test_keep_recording_true_keeps_wav(self, config, tmp_path, audio_wav, stub_transcriber):
         config.output.format = "markdown"
         config.output.keep_recording = True
-        audio_path = tmp_path / "recording.wav"
-        audio_path.write_bytes(b"fake audio data")
-
-        mock_transcriber = mock.MagicMock()
-        mock_transcriber.transcribe.return_value = self._make_transcript()
 
-        with mock.patch("ownscribe.pipeline._create_transcriber", return_value=mock_transcriber):
-            _do_transcribe_and_summarize(config, audio_path, tmp_path, summarize=False)
+        _do_transcribe_and_summarize(config, audio_wav, tmp_path, summarize=False)
 
         assert (tmp_path / "transcript.md").exists()
-        assert audio_path.exists()
-
-    def test_summarization_failure_preserves_transcript(self, tmp_path):
-        from ownscribe.pipeline import _do_transcribe_and_summarize
+        assert audio_wav.exists()
 
-        config = Config()
+    def test_summarization_failure_preserves_transcript(
+        self, config, tmp_path, audio_wav, monkeypatch, stub_transcriber
+    ):
         config.output.format = "markdown"
         config.summarization.enabled = True
-        audio_path = tmp_path / "recording.wav"
-        audio_path.touch()
 
-        mock_transcriber = mock.MagicMock()
-        mock_transcriber.transcribe.return_value = self._make_transcript()
+        def summarize(text):
+            raise Exception("GPU OOM")
 
-        mock_summarizer = mock.MagicMock()
-        mock_summarizer.is_available.return_value = True
-        mock_summarizer.summarize.side_effect = Exception("GPU OOM")
-
-        with (
-            mock.patch("ownscribe.pipeline._create_transcriber", return_value=mock_transcriber),
-            mock.patch("ownscribe.pipeline.create_summarizer", return_value=mock_summarizer),
-        ):
-            _do_transcribe_and_summarize(config, audio_path, tmp_path, summarize=True)
+        self._stub_summarizer(monkeypatch, summarize=summarize)
+        _do_transcribe_and_summarize(config, audio_wav, tmp_path, summarize=True)
 
         assert (tmp_path / "transcript.md").exists()
         assert "Hello world." in (tmp_path / "transcript.md").read_text()
         assert not (tmp_path / "summary.md").exists()
 
 
+@pytest.mark.slow
 class TestRunTranscribeColocation:
     """Test that run_transcribe saves output alongside the input file."""
 
-    def test_transcript_saved_next_to_audio(self, tmp_path):
-        from ownscribe.pipeline import run_transcribe
-
+    def test_transcript_saved_next_to_audio(self, config, tmp_path):
         audio_dir = tmp_path / "meetings" / "2026-01-01_1200"
         audio_dir.mkdir(parents=True)
         audio_path = audio_dir / "recording.wav"
         audio_path.touch()
 
-        config = Config()
         config.output.format = "markdown"
 
         mock_transcriber = mock.MagicMock()
@@ -324,18 +256,16 @@ class TestRunTranscribeColocation:
         assert (audio_dir / "transcript.md").exists()
 
 
+@pytest.mark.slow
 class TestRunSummarizeColocation:
     """Test that run_summarize saves output alongside the input file."""
 
-    def test_summary_saved_next_to_transcript(self, tmp_path):
-        from ownscribe.pipeline import run_summarize
-
+    def test_summary_saved_next_to_transcript(self, config, tmp_path):
         tx_dir = tmp_path / "meetings" / "2026-01-01_1200"
         tx_dir.mkdir(parents=True)
         tx_path = tx_dir / "transcript.md"
         tx_path.write_text("# Transcript\nHello world.")
 
-        config = Config()
         config.summarization.enabled = True
 
         mock_summarizer = mock.MagicMock()
@@ -353,66 +283,45 @@ class TestRunSummarizeColocation:
 class TestResume:
     """Test run_resume artifact detection and dispatch."""
 
-    def test_nothing_to_resume(self, tmp_path):
-        from ownscribe.pipeline import run_resume
-
+    def test_nothing_to_resume(self, config, tmp_path):
         (tmp_path / "transcript.md").write_text("hello")
         (tmp_path / "summary.md").write_text("summary")
 
-        config = Config()
         run_resume(config, str(tmp_path))
         # Should exit cleanly without error
 
-    def test_error_no_audio_no_transcript(self, tmp_path):
-        from ownscribe.pipeline import run_resume
-
-        config = Config()
+    def test_error_no_audio_no_transcript(self, config, tmp_path):
         with mock.patch("sys.exit", side_effect=SystemExit(1)), contextlib.suppress(SystemExit):
             run_resume(config, str(tmp_path))
 
-    def test_resumes_summarize_only(self, tmp_path):
-        from ownscribe.pipeline import run_resume
-
+    def test_resumes_summarize_only(self, config, tmp_path):
         (tmp_path / "transcript.md").write_text("# Transcript\nHello.")
 
-        config = Config()
         config.summarization.enabled = True
 
         with mock.patch("ownscribe.pipeline.run_summarize") as mock_sum:
             run_resume(config, str(tmp_path))
             mock_sum.assert_called_once_with(config, str(tmp_path / "transcript.md"))
 
-    def test_resumes_transcribe_and_summarize(self, tmp_path):
-        from ownscribe.pipeline import run_resume
-
+    def test_resumes_transcribe_and_summarize(self, config, tmp_path):
         audio_path = tmp_path / "recording.wav"
         audio_path.touch()
 
-        config = Config()
-
         with mock.patch("ownscribe.pipeline._do_transcribe_and_summarize") as mock_ts:
             run_resume(config, str(tmp_path))
             mock_ts.assert_called_once_with(config, audio_path, tmp_path)
 
-    def test_finds_non_wav_audio(self, tmp_path):
-        from ownscribe.pipeline import run_resume
-
+    def test_finds_non_wav_audio(self, config, tmp_path):
         audio_path = tmp_path / "meeting.mp3"
         audio_path.touch()
 
-        config = Config()
-
         with mock.patch("ownscribe.pipeline._do_transcribe_and_summarize") as mock_ts:
             run_resume(config, str(tmp_path))
             mock_ts.assert_called_once_with(config, audio_path, tmp_path)
 
-    def test_finds_json_transcript(self, tmp_path):
-        from ownscribe.pipeline import run_resume
-
+    def test_finds_json_transcript(self, config, tmp_path):
         (tmp_path / "transcript.json").write_text('{"segments": []}')
 
-        config = Config()
-
         with mock.patch("ownscribe.pipeline.run_summarize") as mock_sum:
             run_resume(config, str(tmp_path))
             mock_sum.assert_called_once_with(config, str(tmp_path / "transcript.json"))
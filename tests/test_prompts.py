@@ -1,5 +1,7 @@
 """Tests for prompt templates."""
 
+import pytest
+
 from ownscribe.config import TemplateConfig
 from ownscribe.summarization.prompts import (
     MEETING_SUMMARY_PROMPT,
@@ -29,30 +31,23 @@ class TestTemplates:
 
 
 class TestResolveTemplate:
-    def test_default_empty_name_returns_meeting(self):
-        system, prompt = resolve_template("")
+    @pytest.mark.parametrize("name", ["", "meeting", "nonexistent"])
+    def test_resolves_to_meeting(self, name):
+        system, prompt = resolve_template(name)
         assert system == MEETING_SUMMARY_SYSTEM
         assert prompt == MEETING_SUMMARY_PROMPT
 
-    def test_meeting_by_name(self):
-        system, prompt = resolve_template("meeting")
-        assert system == MEETING_SUMMARY_SYSTEM
-        assert prompt == MEETING_SUMMARY_PROMPT
-
-    def test_lecture_by_name(self):
-        system, prompt = resolve_template("lecture")
-        assert "academic" in system.lower() or "lecture" in system.lower()
-        assert "Key Concepts" in prompt
-
-    def test_brief_by_name(self):
-        system, prompt = resolve_template("brief")
-        assert "concise" in system.lower()
-        assert "bullet" in prompt.lower()
-
-    def test_unknown_name_falls_back_to_meeting(self):
-        system, prompt = resolve_template("nonexistent")
-        assert system == MEETING_SUMMARY_SYSTEM
-        assert prompt == MEETING_SUMMARY_PROMPT
+    @pytest.mark.parametrize(
+        ("name", "system_keywords", "prompt_keyword"),
+        [
+            ("lecture", ("academic", "lecture"), "Key Concepts"),
+            ("brief", ("concise",), "bullet points"),
+        ],
+    )
+    def test_builtin_by_name(self, name, system_keywords, prompt_keyword):
+        system, prompt = resolve_template(name)
+        assert any(kw in system.lower() for kw in system_keywords)
+        assert prompt_keyword in prompt
 
     def test_user_defined_template(self):
         user_templates = {
@@ -89,13 +84,7 @@ class TestResolveTemplate:
 
 
 class TestMeetingSummaryPrompt:
-    def test_contains_transcript_placeholder(self):
-        assert "{transcript}" in MEETING_SUMMARY_PROMPT
-
     def test_format_works(self):
         result = MEETING_SUMMARY_PROMPT.format(transcript="Hello, this is a test.")
         assert "Hello, this is a test." in result
         assert "{transcript}" not in result
-
-    def test_system_prompt_is_nonempty(self):
-        assert len(MEETING_SUMMARY_SYSTEM) > 0
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import itertools
+import json
+import re
 from pathlib import Path
 
 import click
 
+from ownscribe.config import Config, SummarizationConfig
 from ownscribe.search import (
     _answer_from_transcripts,
     _build_summary_chunks,
@@ -19,7 +23,9 @@ from ownscribe.search import (
     _parse_relevant_ids,
     _rank_meetings,
     _verify_quotes,
+    ask,
 )
+from ownscribe.summarization.openai_summarizer import OpenAISummarizer
 
 # -- Helpers --
 
@@ -37,19 +43,14 @@ class FakeSummarizer:
 
     def __init__(self, responses: list[str] | None = None):
         self.calls: list[tuple[str, str, bool]] = []
-        self._responses = list(responses or [])
-        self._call_idx = 0
+        self._responses = itertools.cycle(responses) if responses else itertools.repeat('{"relevant": []}')
 
     def chat(
         self, system_prompt: str, user_prompt: str,
         json_mode: bool = False, json_schema: dict | None = None,
     ) -> str:
         self.calls.append((system_prompt, user_prompt, json_mode))
-        if self._responses:
-            resp = self._responses[self._call_idx % len(self._responses)]
-            self._call_idx += 1
-            return resp
-        return '{"relevant": []}'
+        return next(self._responses)
 
 
 # -- Discovery tests --
@@ -69,6 +70,12 @@ class TestDiscoverMeetings:
         assert "Quarterly Planning" in meetings[0].display_name
         assert "2026-02-13 15:01" in meetings[0].display_name
 
+    def test_discover_meetings_caches_summary(self, tmp_path):
+        _make_meeting_dir(tmp_path, "2026-02-13_1501_quarterly-planning", "x" * 400)
+
+        meetings, _ = _discover_meetings(tmp_path, since=None, limit=None)
+        assert meetings[0].summary == "x" * 400
+
     def test_discover_meetings_no_slug(self, tmp_path):
         _make_meeting_dir(tmp_path, "2026-02-16_1433", "Summary without title")
         _make_meeting_dir(tmp_path, "2026-02-13_1501_quarterly-planning", "Summary of Q1 planning")
@@ -90,6 +97,21 @@ class TestDiscoverMeetings:
         assert len(meetings) == 2
         assert all("2026-02" in m.folder_name for m in meetings)
 
+    def test_discover_meetings_since_stops_at_older(self, tmp_path):
+        _make_meeting_dir(tmp_path, "2026-02-13_1501_quarterly-planning", "Summary")
+        # Older than --since and without summary: neither returned nor counted
+        (tmp_path / "2026-01-10_1000_old-meeting").mkdir()
+
+        meetings, skipped = _discover_meetings(tmp_path, since="2026-02-01", limit=None)
+        assert [m.folder_name for m in meetings] == ["2026-02-13_1501_quarterly-planning"]
+        assert skipped == 0
+
+    def test_discover_meetings_invalid_since_ignored(self, tmp_path):
+        _make_meeting_dir(tmp_path, "2026-01-10_1000_old-meeting", "Summary")
+
+        meetings, _ = _discover_meetings(tmp_path, since="not-a-date", limit=None)
+        assert len(meetings) == 1
+
     def test_discover_meetings_limit(self, tmp_path):
         _make_meeting_dir(tmp_path, "2026-02-13_1501_quarterly-planning", "Summary")
         _make_meeting_dir(tmp_path, "2026-02-12_0930_team-standup", "Summary")
@@ -101,6 +123,21 @@ class TestDiscoverMeetings:
         assert meetings[0].folder_name == "2026-02-13_1501_quarterly-planning"
         assert meetings[1].folder_name == "2026-02-12_0930_team-standup"
 
+    def test_discover_meetings_limit_reads_only_kept_summaries(self, tmp_path, monkeypatch):
+        from ownscribe import search
+
+        for day in range(10, 20):
+            _make_meeting_dir(tmp_path, f"2026-02-{day}_1000_meeting", "Summary")
+        (tmp_path / "2026-02-20_1000_no-summary").mkdir()
+
+        read = []
+        monkeypatch.setattr(search, "_read_text", lambda path: read.append(path) or "Summary")
+        meetings, skipped = _discover_meetings(tmp_path, since=None, limit=3)
+
+        assert [m.folder_name for m in meetings] == [f"2026-02-{day}_1000_meeting" for day in (19, 18, 17)]
+        assert len(read) == 3
+        assert skipped == 1
+
     def test_discover_meetings_skips_no_summary(self, tmp_path):
         _make_meeting_dir(tmp_path, "2026-02-13_1501_quarterly-planning", "Summary")
         # Folder with no summary file
@@ -133,6 +170,9 @@ class TestEstimateTokens:
         assert _estimate_tokens("") == 0
         assert _estimate_tokens("hello world") == 2
 
+    def test_estimate_tokens_parts_match_concatenation(self):
+        assert _estimate_tokens("## [id]\n", "abc" * 7) == _estimate_tokens("## [id]\n" + "abc" * 7)
+
 
 # -- Chunking --
 
@@ -155,6 +195,29 @@ class TestBuildSummaryChunks:
         all_ids = {m.folder_name for chunk in chunks for m in chunk}
         assert all_ids == {m.folder_name for m in meetings}
 
+    def test_build_summary_chunks_keeps_order_and_isolates_oversized(self, tmp_path):
+        _make_meeting_dir(tmp_path, "2026-02-13_1000_small-a", "short")
+        _make_meeting_dir(tmp_path, "2026-02-12_1000_huge", "x" * 40000)  # far over budget
+        _make_meeting_dir(tmp_path, "2026-02-11_1000_small-b", "short")
+
+        meetings, _ = _discover_meetings(tmp_path, since=None, limit=None)
+        chunks = _build_summary_chunks(meetings, context_budget=2000)
+        assert [[m.folder_name for m in chunk] for chunk in chunks] == [
+            ["2026-02-13_1000_small-a"],
+            ["2026-02-12_1000_huge"],
+            ["2026-02-11_1000_small-b"],
+        ]
+
+    def test_build_summary_chunks_counts_header_and_summary_together(self, tmp_path):
+        # 23 header + 1183 summary chars is 301 tokens; rounding each part down
+        # separately gives 300, and two of those would squeeze into the 600-token budget
+        _make_meeting_dir(tmp_path, "2026-02-11_1000_a", "x" * 1183)
+        _make_meeting_dir(tmp_path, "2026-02-10_1000_b", "x" * 1183)
+
+        meetings, _ = _discover_meetings(tmp_path, since=None, limit=None)
+        chunks = _build_summary_chunks(meetings, context_budget=2000)
+        assert [len(chunk) for chunk in chunks] == [1, 1]
+
     def test_build_summary_chunks_single(self, tmp_path):
         for i in range(3):
             _make_meeting_dir(
@@ -187,6 +250,14 @@ class TestParseRelevantIds:
     def test_bare_array(self):
         assert _parse_relevant_ids('["id1", "id2"]') == ["id1", "id2"]
 
+    def test_skips_unparseable_bracket_before_json(self):
+        response = 'I checked [a few] meetings: {"relevant": ["id1"]}'
+        assert _parse_relevant_ids(response) == ["id1"]
+
+    def test_relevant_object_wins_over_earlier_array(self):
+        response = 'Meetings [1] and [2] discussed it. Answer: {"relevant": ["3"]}'
+        assert _parse_relevant_ids(response) == ["3"]
+
     def test_unparseable(self):
         assert _parse_relevant_ids("I don't know") is None
 
@@ -217,6 +288,15 @@ class TestExtractKeywords:
         kw = _extract_keywords("")
         assert kw == set()
 
+    def test_custom_stop_words(self):
+        kw = _extract_keywords("Budget meeting notes", stop_words=frozenset({"meeting", "notes"}))
+        assert kw == {"budget"}
+
+    def test_repeated_question_reuses_immutable_result(self):
+        kw = _extract_keywords("What is the budget?")
+        assert isinstance(kw, frozenset)
+        assert _extract_keywords("What is the budget?") is kw
+
 
 # -- Keyword fallback --
 
@@ -277,6 +357,15 @@ class TestFindRelevantMeetings:
         assert len(result) == 1
         assert result[0].folder_name == "2026-02-13_1501_quarterly-planning"
 
+    def test_duplicate_ids_collapse(self, tmp_path):
+        _make_meeting_dir(tmp_path, "2026-02-13_1501_quarterly-planning", "Summary")
+
+        meetings, _ = _discover_meetings(tmp_path, since=None, limit=None)
+        fake = FakeSummarizer(['["2026-02-13_1501_quarterly-planning", "2026-02-13_1501_quarterly-planning"]'])
+
+        result = _find_relevant_meetings(fake, "question", meetings, 100000)
+        assert [m.folder_name for m in result] == ["2026-02-13_1501_quarterly-planning"]
+
     def test_multi_batch(self, tmp_path):
         for i in range(5):
             _make_meeting_dir(
@@ -297,11 +386,35 @@ class TestFindRelevantMeetings:
         ]
         fake = FakeSummarizer(responses)
 
-        result = _find_relevant_meetings(fake, "question", meetings, context_size=2000)
+        # Canned responses follow call order, so run the batches one at a time
+        result = _find_relevant_meetings(fake, "question", meetings, context_size=2000, max_workers=1)
         result_ids = {m.folder_name for m in result}
         assert "2026-02-14_1000_meeting-4" in result_ids
         assert "2026-02-11_1000_meeting-1" in result_ids
 
+    def test_parallel_batches_validated_per_chunk(self, tmp_path):
+        for i in range(5):
+            _make_meeting_dir(tmp_path, f"2026-02-{10+i:02d}_1000_meeting-{i}", "x" * 2000)
+        meetings, _ = _discover_meetings(tmp_path, since=None, limit=None)
+
+        class EchoSummarizer(FakeSummarizer):
+            """Marks even-numbered meetings relevant, based on the batch's own prompt."""
+
+            def chat(self, system_prompt, user_prompt, json_mode=False, json_schema=None):
+                super().chat(system_prompt, user_prompt, json_mode, json_schema)
+                ids = re.findall(r"## \[(\S+meeting-[024])\]", user_prompt)
+                return json.dumps({"relevant": ids})
+
+        fake = EchoSummarizer()
+        result = _find_relevant_meetings(fake, "question", meetings, context_size=2000, max_workers=4)
+
+        assert len(fake.calls) == 5
+        assert sorted(m.folder_name for m in result) == [
+            "2026-02-10_1000_meeting-0",
+            "2026-02-12_1000_meeting-2",
+            "2026-02-14_1000_meeting-4",
+        ]
+
     def test_json_fallback_regex(self, tmp_path):
         _make_meeting_dir(tmp_path, "2026-02-13_1501_quarterly-planning", "Summary")
 
@@ -358,6 +471,24 @@ class TestRankMeetings:
         ranked = _rank_meetings("What was discussed about the budget?", meetings)
         assert ranked[0].folder_name == "2026-02-13_1501_budget-review"
 
+    def test_keyword_overlap_ignores_punctuation(self, tmp_path):
+        # The matching meeting is older, so recency alone would rank it last
+        _make_meeting_dir(tmp_path, "2026-02-12_0930_budget-review", "Budget, review and spending.")
+        _make_meeting_dir(tmp_path, "2026-02-13_1501_team-standup", "standup tasks blockers")
+
+        meetings, _ = _discover_meetings(tmp_path, since=None, limit=None)
+        ranked = _rank_meetings("what about the budget?", meetings)
+        assert ranked[0].folder_name == "2026-02-12_0930_budget-review"
+
+    def test_keyword_overlap_counts_every_question_word(self, tmp_path):
+        # Stop words count too: "who" and "the" outweigh the single match on "launch"
+        _make_meeting_dir(tmp_path, "2026-02-12_0930_roles", "who is on the team")
+        _make_meeting_dir(tmp_path, "2026-02-13_1501_launch", "launch date moved")
+
+        meetings, _ = _discover_meetings(tmp_path, since=None, limit=None)
+        ranked = _rank_meetings("who owns the launch plan?", meetings)
+        assert ranked[0].folder_name == "2026-02-12_0930_roles"
+
     def test_speaker_boost(self, tmp_path):
         _make_meeting_dir(tmp_path, "2026-02-13_1501_planning", "Bob discussed the timeline")
         _make_meeting_dir(tmp_path, "2026-02-12_0930_standup", "Anna mentioned the deadline and blockers")
@@ -366,6 +497,14 @@ class TestRankMeetings:
         ranked = _rank_meetings("What did Anna say about the deadline?", meetings)
         assert ranked[0].folder_name == "2026-02-12_0930_standup"
 
+    def test_speaker_boost_matches_whole_names(self, tmp_path):
+        _make_meeting_dir(tmp_path, "2026-02-13_1501_planning", "Annabelle discussed what comes next")
+        _make_meeting_dir(tmp_path, "2026-02-12_0930_standup", "Ann reviewed the budget")
+
+        meetings, _ = _discover_meetings(tmp_path, since=None, limit=None)
+        ranked = _rank_meetings("What did Ann say?", meetings)
+        assert ranked[0].folder_name == "2026-02-12_0930_standup"
+
 
 # -- Answer from transcripts --
 
@@ -410,6 +549,18 @@ class TestAnswerFromTranscripts:
         assert "Answer based on available transcripts." in answer
         assert skipped > 0
 
+    def test_oversized_transcript_not_read(self, tmp_path, monkeypatch):
+        _make_meeting_dir(tmp_path, "2026-02-13_1501_big-meeting", "Summary", "x" * 100000)
+        meetings, _ = _discover_meetings(tmp_path, since=None, limit=None)
+
+        def fail_read(path):
+            raise AssertionError(f"{path} should not be read")
+
+        monkeypatch.setattr("ownscribe.search._read_text", fail_read)
+        answer, skipped = _answer_from_transcripts(FakeSummarizer(), "question", meetings, context_size=2000)
+        assert skipped == 1
+        assert answer == "No transcript text available for the relevant meetings."
+
 
 # -- Quote verification --
 
@@ -476,6 +627,10 @@ class TestExtractQuotes:
         quotes = _extract_quotes(text)
         assert any("deadline" in q for q in quotes)
 
+    def test_blockquote_lines_joined_per_run(self):
+        text = "> first line\n>  second line\nbetween\n> other quote"
+        assert _extract_quotes(text) == ["first line second line", "other quote"]
+
 
 class TestKeyPhrases:
     def test_short_quote(self):
@@ -487,12 +642,19 @@ class TestKeyPhrases:
         assert len(phrases) >= 1
         assert all(len(p.split()) >= 8 for p in phrases)
 
+    def test_long_quote_spans_normalize_whitespace(self):
+        quote = "  ".join(f"w{i}" for i in range(30))
+        phrases = _key_phrases(quote)
+        assert phrases == [
+            " ".join(f"w{i}" for i in range(start, start + 12)) for start in (0, 7, 14)
+        ]
+
 
 # -- Integration test --
 
 
 class TestAskIntegration:
-    def test_end_to_end(self, httpserver, tmp_path, monkeypatch):
+    def test_end_to_end(self, httpserver, ollama_chat_response, tmp_path, monkeypatch):
         # Set up mock meetings
         _make_meeting_dir(
             tmp_path,
@@ -533,10 +695,12 @@ class TestAskIntegration:
         }
         httpserver.expect_ordered_request("/api/tags", method="GET").respond_with_json({"models": []})
         httpserver.expect_ordered_request("/api/show", method="POST").respond_with_json(show_response)
-        httpserver.expect_ordered_request("/api/chat", method="POST").respond_with_json(find_response)
-        httpserver.expect_ordered_request("/api/chat", method="POST").respond_with_json(answer_response)
-
-        from ownscribe.config import Config
+        httpserver.expect_ordered_request("/api/chat", method="POST").respond_with_response(
+            ollama_chat_response(find_response),
+        )
+        httpserver.expect_ordered_request("/api/chat", method="POST").respond_with_response(
+            ollama_chat_response(answer_response),
+        )
 
         config = Config()
         config.output.dir = str(tmp_path)
@@ -544,8 +708,6 @@ class TestAskIntegration:
         config.summarization.backend = "ollama"
         config.summarization.model = "test-model"
 
-        from ownscribe.search import ask
-
         output_lines: list[str] = []
         monkeypatch.setattr(click, "echo", lambda msg="": output_lines.append(str(msg)))
 
@@ -587,9 +749,6 @@ def _openai_400_response() -> tuple[dict, int]:
 class TestOpenAIChatJsonModeFallback:
     def test_openai_chat_json_mode_fallback(self, httpserver):
         """json_object and json_schema both fail → falls back to no response_format."""
-        from ownscribe.config import SummarizationConfig
-        from ownscribe.summarization.openai_summarizer import OpenAISummarizer
-
         body_400, status_400 = _openai_400_response()
         ep = "/v1/chat/completions"
         # 1st attempt (json_object) → 400
@@ -616,9 +775,6 @@ class TestOpenAIChatJsonModeFallback:
 
     def test_openai_chat_json_schema_fallback(self, httpserver):
         """json_object fails → falls back to json_schema which succeeds."""
-        from ownscribe.config import SummarizationConfig
-        from ownscribe.summarization.openai_summarizer import OpenAISummarizer
-
         body_400, status_400 = _openai_400_response()
         ep = "/v1/chat/completions"
         # 1st attempt (json_object) → 400
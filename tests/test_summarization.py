@@ -2,7 +2,14 @@
 
 from __future__ import annotations
 
-from ownscribe.config import SummarizationConfig, TemplateConfig
+import json
+import os
+
+from ownscribe.config import Config, SummarizationConfig, TemplateConfig
+from ownscribe.summarization import create_summarizer
+from ownscribe.summarization.cache import CachingSummarizer
+from ownscribe.summarization.ollama_summarizer import OllamaSummarizer
+from ownscribe.summarization.openai_summarizer import OpenAISummarizer
 from ownscribe.summarization.prompts import (
     LECTURE_SUMMARY_SYSTEM,
     clean_response,
@@ -26,6 +33,10 @@ class TestCleanResponse:
         raw = "<THINK>stuff</THINK>\nresult"
         assert clean_response(raw) == "result"
 
+    def test_mixed_case_tags(self):
+        raw = "<Think>stuff</tHiNk>\nresult"
+        assert clean_response(raw) == "result"
+
     def test_empty_think_block(self):
         raw = "<think></think>result"
         assert clean_response(raw) == "result"
@@ -34,18 +45,25 @@ class TestCleanResponse:
         raw = "1. Analyze\n2. Plan\n</think>\n## Summary\nActual content"
         assert clean_response(raw) == "## Summary\nActual content"
 
+    def test_non_ascii_before_tags(self):
+        # "İ".lower() is two characters long; tag positions must still line up
+        raw = "İstanbul <think>plan</think>\nresult"
+        assert clean_response(raw) == "İstanbul result"
+
+    def test_other_closing_tags_kept(self):
+        text = "  Use <b>bold</b> here.\n"
+        assert clean_response(text) == "Use <b>bold</b> here."
+
 
 class TestOllamaCustomPrompts:
     """Test that custom prompts via user-defined templates are passed through to Ollama."""
 
-    def test_custom_system_and_user_prompt(self, httpserver):
-        import json
-
+    def test_custom_system_and_user_prompt(self, httpserver, ollama_chat_response):
         response_body = {
             "message": {"role": "assistant", "content": "Custom summary."},
             "done": True,
         }
-        httpserver.expect_request("/api/chat", method="POST").respond_with_json(response_body)
+        httpserver.expect_request("/api/chat", method="POST").respond_with_response(ollama_chat_response(response_body))
 
         config = SummarizationConfig(
             host=httpserver.url_for(""),
@@ -60,8 +78,6 @@ class TestOllamaCustomPrompts:
             ),
         }
 
-        from ownscribe.summarization.ollama_summarizer import OllamaSummarizer
-
         summarizer = OllamaSummarizer(config, templates)
         summarizer.summarize("Alice: Hello")
 
@@ -75,8 +91,6 @@ class TestOpenAICustomPrompts:
     """Test that custom prompts via user-defined templates are passed through to OpenAI."""
 
     def test_custom_system_and_user_prompt(self, httpserver):
-        import json
-
         response_body = {
             "id": "chatcmpl-test",
             "object": "chat.completion",
@@ -104,8 +118,6 @@ class TestOpenAICustomPrompts:
             ),
         }
 
-        from ownscribe.summarization.openai_summarizer import OpenAISummarizer
-
         summarizer = OpenAISummarizer(config, templates)
         summarizer.summarize("Alice: Hello")
 
@@ -118,14 +130,12 @@ class TestOpenAICustomPrompts:
 class TestOllamaTemplatePassthrough:
     """Test that built-in templates are resolved correctly by Ollama."""
 
-    def test_lecture_template(self, httpserver):
-        import json
-
+    def test_lecture_template(self, httpserver, ollama_chat_response):
         response_body = {
             "message": {"role": "assistant", "content": "Lecture notes."},
             "done": True,
         }
-        httpserver.expect_request("/api/chat", method="POST").respond_with_json(response_body)
+        httpserver.expect_request("/api/chat", method="POST").respond_with_response(ollama_chat_response(response_body))
 
         config = SummarizationConfig(
             host=httpserver.url_for(""),
@@ -134,8 +144,6 @@ class TestOllamaTemplatePassthrough:
             template="lecture",
         )
 
-        from ownscribe.summarization.ollama_summarizer import OllamaSummarizer
-
         summarizer = OllamaSummarizer(config)
         summarizer.summarize("Today we discuss photosynthesis.")
 
@@ -150,8 +158,6 @@ class TestOpenAITemplatePassthrough:
     """Test that built-in templates are resolved correctly by OpenAI."""
 
     def test_lecture_template(self, httpserver):
-        import json
-
         response_body = {
             "id": "chatcmpl-test",
             "object": "chat.completion",
@@ -173,8 +179,6 @@ class TestOpenAITemplatePassthrough:
             template="lecture",
         )
 
-        from ownscribe.summarization.openai_summarizer import OpenAISummarizer
-
         summarizer = OpenAISummarizer(config)
         summarizer.summarize("Today we discuss photosynthesis.")
 
@@ -188,19 +192,15 @@ class TestOpenAITemplatePassthrough:
 class TestOllamaGenerateTitle:
     """Test OllamaSummarizer.generate_title against a mock HTTP server."""
 
-    def test_generate_title(self, httpserver):
-        import json
-
+    def test_generate_title(self, httpserver, ollama_chat_response):
         response_body = {
             "message": {"role": "assistant", "content": "Q3 Budget Review"},
             "done": True,
         }
-        httpserver.expect_request("/api/chat", method="POST").respond_with_json(response_body)
+        httpserver.expect_request("/api/chat", method="POST").respond_with_response(ollama_chat_response(response_body))
 
         config = SummarizationConfig(host=httpserver.url_for(""), backend="ollama", model="test-model")
 
-        from ownscribe.summarization.ollama_summarizer import OllamaSummarizer
-
         summarizer = OllamaSummarizer(config)
         result = summarizer.generate_title("The meeting covered Q3 budget.")
 
@@ -211,17 +211,15 @@ class TestOllamaGenerateTitle:
         assert body["messages"][0]["content"] == "You generate short meeting titles."
         assert "Q3 budget" in body["messages"][1]["content"]
 
-    def test_generate_title_strips_think_tags(self, httpserver):
+    def test_generate_title_strips_think_tags(self, httpserver, ollama_chat_response):
         response_body = {
             "message": {"role": "assistant", "content": "<think>hmm</think>\nBudget Planning"},
             "done": True,
         }
-        httpserver.expect_request("/api/chat", method="POST").respond_with_json(response_body)
+        httpserver.expect_request("/api/chat", method="POST").respond_with_response(ollama_chat_response(response_body))
 
         config = SummarizationConfig(host=httpserver.url_for(""), backend="ollama", model="test-model")
 
-        from ownscribe.summarization.ollama_summarizer import OllamaSummarizer
-
         summarizer = OllamaSummarizer(config)
         result = summarizer.generate_title("summary text")
 
@@ -232,17 +230,15 @@ class TestOllamaGenerateTitle:
 class TestOllamaSummarizer:
     """Test OllamaSummarizer against a mock HTTP server."""
 
-    def test_summarize(self, httpserver):
+    def test_summarize(self, httpserver, ollama_chat_response):
         response_body = {
             "message": {"role": "assistant", "content": "<think>reasoning</think>\n## Summary\nMeeting went well."},
             "done": True,
         }
-        httpserver.expect_request("/api/chat", method="POST").respond_with_json(response_body)
+        httpserver.expect_request("/api/chat", method="POST").respond_with_response(ollama_chat_response(response_body))
 
         config = SummarizationConfig(host=httpserver.url_for(""), backend="ollama", model="test-model")
 
-        from ownscribe.summarization.ollama_summarizer import OllamaSummarizer
-
         summarizer = OllamaSummarizer(config)
         result = summarizer.summarize("Alice: Hello\nBob: Hi")
 
@@ -251,21 +247,31 @@ class TestOllamaSummarizer:
         assert "## Summary" in result
         assert "Meeting went well." in result
 
+    def test_summarize_joins_streamed_chunks(self, httpserver, ollama_chat_response):
+        chunks = [
+            {"message": {"role": "assistant", "content": "<thi"}, "done": False},
+            {"message": {"role": "assistant", "content": "nk>plan</think>\n## Sum"}, "done": False},
+            {"message": {"role": "assistant", "content": "mary\nDone."}, "done": True},
+        ]
+        httpserver.expect_request("/api/chat", method="POST").respond_with_response(ollama_chat_response(*chunks))
+
+        config = SummarizationConfig(host=httpserver.url_for(""), backend="ollama", model="test-model")
+
+        result = OllamaSummarizer(config).summarize("Alice: Hello")
+        assert result == "## Summary\nDone."
+        assert json.loads(httpserver.log[0][0].data)["stream"] is True
+
     def test_is_available_success(self, httpserver):
         httpserver.expect_request("/api/tags", method="GET").respond_with_json({"models": []})
 
         config = SummarizationConfig(host=httpserver.url_for(""), backend="ollama", model="test-model")
 
-        from ownscribe.summarization.ollama_summarizer import OllamaSummarizer
-
         summarizer = OllamaSummarizer(config)
         assert summarizer.is_available() is True
 
     def test_is_available_failure(self):
         config = SummarizationConfig(host="http://localhost:1", backend="ollama", model="test-model")
 
-        from ownscribe.summarization.ollama_summarizer import OllamaSummarizer
-
         summarizer = OllamaSummarizer(config)
         assert summarizer.is_available() is False
 
@@ -274,8 +280,6 @@ class TestOpenAIGenerateTitle:
     """Test OpenAISummarizer.generate_title against a mock HTTP server."""
 
     def test_generate_title(self, httpserver):
-        import json
-
         response_body = {
             "id": "chatcmpl-test",
             "object": "chat.completion",
@@ -292,8 +296,6 @@ class TestOpenAIGenerateTitle:
 
         config = SummarizationConfig(host=httpserver.url_for(""), backend="openai", model="test-model")
 
-        from ownscribe.summarization.openai_summarizer import OpenAISummarizer
-
         summarizer = OpenAISummarizer(config)
         result = summarizer.generate_title("The meeting covered Q3 budget.")
 
@@ -321,8 +323,6 @@ class TestOpenAIGenerateTitle:
 
         config = SummarizationConfig(host=httpserver.url_for(""), backend="openai", model="test-model")
 
-        from ownscribe.summarization.openai_summarizer import OpenAISummarizer
-
         summarizer = OpenAISummarizer(config)
         result = summarizer.generate_title("summary text")
 
@@ -350,8 +350,6 @@ class TestOpenAISummarizer:
 
         config = SummarizationConfig(host=httpserver.url_for(""), backend="openai", model="test-model")
 
-        from ownscribe.summarization.openai_summarizer import OpenAISummarizer
-
         summarizer = OpenAISummarizer(config)
         result = summarizer.summarize("Alice: Hello\nBob: Hi")
 
@@ -363,16 +361,12 @@ class TestOpenAISummarizer:
 
         config = SummarizationConfig(host=httpserver.url_for(""), backend="openai", model="test-model")
 
-        from ownscribe.summarization.openai_summarizer import OpenAISummarizer
-
         summarizer = OpenAISummarizer(config)
         assert summarizer.is_available() is True
 
     def test_is_available_failure(self):
         config = SummarizationConfig(host="http://localhost:1", backend="openai", model="test-model")
 
-        from ownscribe.summarization.openai_summarizer import OpenAISummarizer
-
         summarizer = OpenAISummarizer(config)
         assert summarizer.is_available() is False
 
@@ -396,11 +390,74 @@ class TestOpenAISummarizer:
 
         config = SummarizationConfig(host=httpserver.url_for(""), backend="openai", model="test-model")
 
-        from ownscribe.summarization.openai_summarizer import OpenAISummarizer
-
         summarizer = OpenAISummarizer(config)
         result = summarizer.summarize("transcript text")
 
         assert "<think>" not in result
         assert "## Summary" in result
         assert "Cleaned output." in result
+
+
+class _CountingSummarizer:
+    """Inner summarizer stub that numbers its summaries."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def summarize(self, transcript_text: str) -> str:
+        self.calls += 1
+        return f"summary {self.calls}"
+
+
+class TestCachingSummarizer:
+    def _make(self, tmp_path, **config_kwargs):
+        inner = _CountingSummarizer()
+        config = SummarizationConfig(cache=True, **config_kwargs)
+        return inner, CachingSummarizer(inner, config, cache_dir=tmp_path)
+
+    def test_identical_transcript_hits_cache(self, tmp_path):
+        inner, summarizer = self._make(tmp_path)
+
+        assert summarizer.summarize("Alice: Hello") == "summary 1"
+        assert summarizer.summarize("Alice: Hello") == "summary 1"
+        assert inner.calls == 1
+
+    def test_changed_transcript_misses(self, tmp_path):
+        _, summarizer = self._make(tmp_path)
+
+        summarizer.summarize("Alice: Hello")
+        assert summarizer.summarize("Alice: Hello!") == "summary 2"
+
+    def test_template_and_model_are_part_of_key(self, tmp_path):
+        _, summarizer = self._make(tmp_path)
+        summarizer.summarize("Alice: Hello")
+
+        _, lecture = self._make(tmp_path, template="lecture")
+        _, other_model = self._make(tmp_path, model="other")
+        assert lecture.summarize("Alice: Hello") == "summary 1"
+        assert other_model.summarize("Alice: Hello") == "summary 1"
+        assert len(list(tmp_path.glob("*.md"))) == 3
+
+    def test_failed_write_keeps_summary_and_leaves_no_temp_file(self, tmp_path, monkeypatch):
+        _, summarizer = self._make(tmp_path)
+
+        def fail(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", fail)
+        assert summarizer.summarize("Alice: Hello") == "summary 1"
+        assert list(tmp_path.iterdir()) == []
+
+    def test_unreadable_entry_is_a_miss(self, tmp_path):
+        inner, summarizer = self._make(tmp_path)
+        (tmp_path / f"{summarizer._key('Alice: Hello')}.md").write_bytes(b"\xff\xfe\xfa")
+
+        assert summarizer.summarize("Alice: Hello") == "summary 1"
+        assert inner.calls == 1
+
+    def test_create_summarizer_wraps_only_when_enabled(self):
+        config = Config()
+        assert isinstance(create_summarizer(config), OllamaSummarizer)
+
+        config.summarization.cache = True
+        assert isinstance(create_summarizer(config), CachingSummarizer)
@@ -2,17 +2,146 @@
 
 from __future__ import annotations
 
+import sys
+from types import SimpleNamespace
 from unittest import mock
 
 import pytest
 
+from ownscribe.config import DiarizationConfig, TranscriptionConfig
+from ownscribe.transcription import whisperx_transcriber
+from ownscribe.transcription.whisperx_transcriber import WhisperXTranscriber, _assign_speakers, _ffmpeg_path
+
 
 class TestFfmpegCheck:
-    def test_missing_ffmpeg_exits(self):
-        from ownscribe.config import TranscriptionConfig
-        from ownscribe.transcription.whisperx_transcriber import WhisperXTranscriber
+    @pytest.fixture(autouse=True)
+    def _clear_ffmpeg_cache(self):
+        # The PATH lookup is cached per process; start and leave each test uncached
+        _ffmpeg_path.cache_clear()
+        yield
+        _ffmpeg_path.cache_clear()
 
+    def test_missing_ffmpeg_exits(self):
         transcriber = WhisperXTranscriber(TranscriptionConfig(), None)
 
         with mock.patch("shutil.which", return_value=None), pytest.raises(SystemExit):
             transcriber.transcribe(mock.MagicMock())
+
+    def test_ffmpeg_lookup_cached(self):
+        with mock.patch("shutil.which", return_value="/usr/bin/ffmpeg") as which:
+            assert _ffmpeg_path() == "/usr/bin/ffmpeg"
+            assert _ffmpeg_path() == "/usr/bin/ffmpeg"
+        which.assert_called_once_with("ffmpeg")
+
+
+class TestAlignmentGate:
+    """Forced alignment only runs when word timings are needed."""
+
+    @pytest.fixture
+    def fake_whisperx(self, monkeypatch):
+        segments = [{"text": "Hello.", "start": 0.0, "end": 1.0}]
+        model = mock.Mock()
+        model.transcribe.return_value = {"segments": segments, "language": "en"}
+        fake = mock.Mock()
+        fake.load_model.return_value = model
+        fake.load_align_model.return_value = ("align-model", {})
+        fake.align.return_value = {"segments": segments}
+        monkeypatch.setitem(sys.modules, "whisperx", fake)
+        monkeypatch.setattr(whisperx_transcriber, "_load_audio", lambda path: SimpleNamespace(shape=(16000,)))
+        monkeypatch.setattr(WhisperXTranscriber, "_diarize", lambda self, audio, result: result)
+        return fake
+
+    @pytest.mark.parametrize(
+        ("word_timestamps", "diarize", "aligned"),
+        [(False, False, False), (True, False, True), (False, True, True)],
+        ids=["default", "word-timestamps", "diarization"],
+    )
+    def test_align_only_when_needed(self, fake_whisperx, word_timestamps, diarize, aligned):
+        diar_config = DiarizationConfig(enabled=diarize, hf_token="hf_test" if diarize else "")
+        transcriber = WhisperXTranscriber(TranscriptionConfig(word_timestamps=word_timestamps), diar_config)
+
+        result = transcriber._transcribe_inner(mock.MagicMock())
+
+        assert fake_whisperx.align.called is aligned
+        assert fake_whisperx.load_align_model.called is aligned
+        assert [seg.text for seg in result.segments] == ["Hello."]
+
+
+class TestAssignSpeakers:
+    def _result(self) -> dict:
+        return {
+            "segments": [
+                {
+                    "text": "Hello there.",
+                    "start": 0.0,
+                    "end": 2.0,
+                    "words": [
+                        {"word": "Hello", "start": 0.0, "end": 0.8},
+                        {"word": "there.", "start": 1.2, "end": 2.0},
+                    ],
+                },
+                {
+                    "text": "Hi.",
+                    "start": 2.5,
+                    "end": 3.0,
+                    "words": [{"word": "Hi."}],  # unaligned word has no timestamps
+                },
+            ]
+        }
+
+    def test_majority_overlap_wins(self):
+        pytest.importorskip("numpy")
+
+        turns = [(0.0, 0.9, "SPEAKER_00"), (0.9, 2.6, "SPEAKER_01"), (2.6, 3.5, "SPEAKER_00")]
+        result = _assign_speakers(turns, self._result())
+
+        first, second = result["segments"]
+        assert first["speaker"] == "SPEAKER_01"  # 1.1s vs 0.9s of SPEAKER_00
+        assert first["words"][0]["speaker"] == "SPEAKER_00"
+        assert first["words"][1]["speaker"] == "SPEAKER_01"
+        assert second["speaker"] == "SPEAKER_00"
+        assert "speaker" not in second["words"][0]
+
+    def test_no_overlap_leaves_unlabeled(self):
+        pytest.importorskip("numpy")
+
+        result = _assign_speakers([(10.0, 12.0, "SPEAKER_00")], self._result())
+        assert all("speaker" not in seg for seg in result["segments"])
+
+    def test_no_turns(self):
+        result = self._result()
+        assert _assign_speakers([], result) is result
+
+
+class TestLoadAudio:
+    def test_blockwise_resample_matches_whole_file(self, tmp_path, monkeypatch):
+        np = pytest.importorskip("numpy")
+        sf = pytest.importorskip("soundfile")
+        torch = pytest.importorskip("torch")
+        AF = pytest.importorskip("torchaudio.functional")
+
+        rng = np.random.default_rng(0)
+        data = rng.uniform(-0.5, 0.5, size=(48000, 2)).astype(np.float32)
+        path = tmp_path / "stereo.wav"
+        sf.write(path, data, 48000, subtype="FLOAT")
+
+        # Small blocks so the recording spans many of them, including a partial last one
+        monkeypatch.setattr(whisperx_transcriber, "_BLOCK_FRAMES", 5000)
+        audio = whisperx_transcriber._load_audio(path)
+
+        expected = AF.resample(
+            torch.from_numpy(data.mean(axis=1)), 48000, 16000, resampling_method="sinc_interp_kaiser"
+        ).numpy()
+        assert audio.dtype == np.float32
+        assert audio.flags["C_CONTIGUOUS"]
+        np.testing.assert_allclose(audio, expected, atol=1e-5)
+
+    def test_mono_16k_read_directly(self, tmp_path):
+        np = pytest.importorskip("numpy")
+        sf = pytest.importorskip("soundfile")
+
+        data = np.linspace(-1, 1, 16000, dtype=np.float32)
+        path = tmp_path / "mono.wav"
+        sf.write(path, data, 16000, subtype="FLOAT")
+
+        np.testing.assert_array_equal(whisperx_transcriber._load_audio(path), data)